@@ -6,9 +6,7 @@ Provides the main entry point for the lazy-bird command.
 """
 
 import sys
-import subprocess
 import argparse
-from pathlib import Path
 from typing import List, Optional
 
 from lazy_bird import __version__, PACKAGE_ROOT
@@ -37,6 +35,13 @@ def print_banner():
     print(banner)
 
 
+def _call(cmd: List[str]) -> int:
+    """Run a command and return its exit code"""
+    # Imported here so `lazy-bird --help` doesn't pay for subprocess
+    import subprocess
+    return subprocess.call(cmd)
+
+
 def run_wizard(args: List[str]) -> int:
     """Run the setup wizard"""
     wizard_script = PACKAGE_ROOT / "wizard.sh"
@@ -45,7 +50,7 @@ def run_wizard(args: List[str]) -> int:
         return 1
 
     cmd = ["bash", str(wizard_script)] + args
-    return subprocess.call(cmd)
+    return _call(cmd)
 
 
 def run_server(port: int = 5000, host: str = "127.0.0.1") -> int:
@@ -53,14 +58,14 @@ def run_server(port: int = 5000, host: str = "127.0.0.1") -> int:
     try:
         # Import here to avoid import errors if Flask is not installed
         sys.path.insert(0, str(PACKAGE_ROOT / "web" / "backend"))
-        from app import app
+        from app import run_http_server
 
         print(f"🚀 Starting Lazy_Bird web server on http://{host}:{port}")
         print(f"📊 Dashboard: http://{host}:{port}")
         print(f"📡 API: http://{host}:{port}/api")
         print()
 
-        app.run(host=host, port=port, debug=False)
+        run_http_server(host, port)
         return 0
     except ImportError as e:
         print(f"Error: Failed to import Flask application: {e}")
@@ -79,7 +84,7 @@ def run_godot_server(args: List[str]) -> int:
         return 1
 
     cmd = [sys.executable, str(script)] + args
-    return subprocess.call(cmd)
+    return _call(cmd)
 
 
 def run_issue_watcher(args: List[str]) -> int:
@@ -90,7 +95,7 @@ def run_issue_watcher(args: List[str]) -> int:
         return 1
 
     cmd = [sys.executable, str(script)] + args
-    return subprocess.call(cmd)
+    return _call(cmd)
 
 
 def run_project_manager(args: List[str]) -> int:
@@ -101,7 +106,7 @@ def run_project_manager(args: List[str]) -> int:
         return 1
 
     cmd = [sys.executable, str(script)] + args
-    return subprocess.call(cmd)
+    return _call(cmd)
 
 
 def main(argv: Optional[List[str]] = None) -> int:
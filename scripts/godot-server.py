@@ -8,7 +8,8 @@ allowing multiple Claude Code agents to coordinate test execution safely.
 
 Features:
 - REST API for test submission and status checking
-- Sequential test execution (one at a time)
+- Sequential test execution per project (--max-workers runs different
+  projects in parallel)
 - Job queue management with priorities
 - Test result parsing (gdUnit4, GUT)
 - Timeout enforcement
@@ -16,48 +17,88 @@ Features:
 - Artifact storage
 
 Usage:
-    python3 godot-server.py [--port 5000] [--host 127.0.0.1]
+    python3 godot-server.py [--port 5000] [--host 127.0.0.1] [--server auto|waitress|flask]
+
+When waitress is installed (pip3 install waitress) the API is served by it
+instead of the Flask development server; idle status-polling connections wait
+in its socket loop rather than each holding a request thread.
 
 API Endpoints:
     POST   /test/submit        - Submit new test job
     GET    /test/status/<id>   - Check job status
     GET    /test/results/<id>  - Get detailed results
+    GET    /test/artifacts/<id>/log - Download the full test output log
     DELETE /test/cancel/<id>   - Cancel queued/running job
     GET    /health             - Health check
     GET    /queue              - View current queue
 """
 
 import os
+import re
+import atexit
 import sys
 import json
+import shutil
 import time
+import signal
 import uuid
 import subprocess
+import itertools
 import threading
 import logging
 import xml.etree.ElementTree as ET
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from enum import Enum
-from dataclasses import dataclass, asdict
-from typing import Optional, Dict, List, Any
-from queue import Queue, Empty
+from dataclasses import dataclass
+from typing import Optional, Dict, List, Set, Any
+from queue import PriorityQueue
 from pathlib import Path
 
 try:
-    from flask import Flask, request, jsonify, send_file
-    import psutil
-except ImportError:
-    print("Error: Required packages not installed")
-    print("Install: pip3 install flask psutil")
-    sys.exit(1)
+    import orjson
+except ImportError:  # Optional - falls back to the stdlib json module
+    orjson = None
+
+# Flask is imported by _load_flask() from main(), so `--help` and importing
+# this module for its job/executor classes don't pay for Flask + Werkzeug.
+Flask = request = jsonify = send_file = None
 
 # Configuration
 # Default artifacts directory (can be overridden by env var or command line)
 DEFAULT_ARTIFACTS_DIR = os.environ.get('LAZY_BIRD_ARTIFACTS_DIR',
                                         str(Path.home() / '.local/share/lazy_birtd/tests'))
+# Godot binary (resolved to an absolute path once at startup)
+GODOT_BIN = os.environ.get('GODOT_BIN', 'godot')
 MAX_QUEUE_SIZE = 50
 DEFAULT_TIMEOUT = 300  # 5 minutes
+KILL_GRACE_SECONDS = 2  # SIGTERM -> SIGKILL delay on timeout
 JOB_RETENTION_DAYS = 7
+RECENT_JOBS_LIMIT = 1024  # Finished jobs kept in memory for status lookups
+OUTPUT_TAIL_LINES = 10_000  # Lines of output kept in memory (full log is on disk)
+LOG_BUFFER_SIZE = 1 << 16  # Batch output.log writes into 64 KiB chunks
+CALLBACK_WORKERS = 4
+CALLBACK_TIMEOUT = 5  # seconds
+SERVER_THREADS = 8  # waitress request threads
+KEEP_ALIVE_SECONDS = 30  # Agents polling /test/status reuse their connection
+
+# Godot arguments per test framework (after the binary and --path)
+_GDUNIT4_ARGS = ("--headless", "-s", "res://addons/gdUnit4/bin/GdUnitCmdTool.gd",
+                 "--ignoreHeadlessMode")
+_GDUNIT4_ALL_SUITES = ("-a", "test/")
+_GDUNIT4_JUNIT = ("--report-format", "junit", "--report-path")
+_GUT_ARGS = ("--headless", "-s", "res://addons/gut/gut_cmdln.gd", "-gdir=res://test")
+
+# Result parsers
+# GUT output format: "Tests run: X  Passing: Y  Failing: Z"
+_GUT_RE = re.compile(r'Tests run:\s*(\d+)\s+Passing:\s*(\d+)\s+Failing:\s*(\d+)')
+# Fallback patterns for common test runner summaries
+_GENERIC_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(\d+)\s+tests.*(\d+)\s+passed.*(\d+)\s+failed',
+    r'Tests:\s*(\d+),\s*Passed:\s*(\d+),\s*Failed:\s*(\d+)',
+    r'PASSED.*=\s*(\d+)',
+))
 
 # Logging setup
 logging.basicConfig(
@@ -66,8 +107,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger('godot-server')
 
-# Flask app
-app = Flask(__name__)
+# Flask app (created in main())
+app = None
 
 
 class JobStatus(Enum):
@@ -80,6 +121,11 @@ class JobStatus(Enum):
     CANCELLED = "cancelled"
 
 
+# States a job never leaves
+FINAL_STATUSES = frozenset({JobStatus.COMPLETE, JobStatus.FAILED,
+                            JobStatus.TIMEOUT, JobStatus.CANCELLED})
+
+
 class Priority(Enum):
     """Job priority levels"""
     HIGH = 1    # Retry attempts, critical fixes
@@ -87,7 +133,14 @@ class Priority(Enum):
     LOW = 3     # Non-blocking refactors
 
 
-@dataclass
+_PRIORITY_BY_NAME = {p.name: p for p in Priority}
+
+
+# dataclass(slots=True) needs Python 3.10+; older versions keep __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class TestJob:
     """Test job specification"""
     job_id: str
@@ -103,6 +156,7 @@ class TestJob:
     # Status tracking
     status: JobStatus = JobStatus.QUEUED
     submitted_at: Optional[datetime] = None
+    submitted_at_iso: Optional[str] = None  # Encoded once at submission
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
 
@@ -133,46 +187,126 @@ class JobQueue:
     """Thread-safe job queue with priority support"""
 
     def __init__(self, maxsize: int = MAX_QUEUE_SIZE):
-        self.queue = Queue(maxsize=maxsize)
+        # Entries are (priority, sequence, job): lower priority values run
+        # first and the sequence number keeps FIFO order within a priority.
+        # Capacity is enforced in submit(), cancelled entries are dropped
+        # when they reach the front in get_next().
+        self.queue = PriorityQueue()
+        self.maxsize = maxsize
+        self._seq = itertools.count()
+        # Queued and running jobs. Finished jobs move to self.recent without
+        # their output (it is in the job's log file), oldest evicted first,
+        # so memory stays bounded regardless of how many jobs have run.
         self.jobs: Dict[str, TestJob] = {}
-        self.active_job: Optional[TestJob] = None
+        self.recent: "OrderedDict[str, TestJob]" = OrderedDict()
+        self.recent_limit = RECENT_JOBS_LIMIT
+        # Queued jobs in dequeue order: one FIFO bucket per priority, highest
+        # first, so position/depth don't scan self.jobs
+        self._queued_order: Dict[Priority, "OrderedDict[str, TestJob]"] = {
+            p: OrderedDict() for p in sorted(Priority, key=lambda p: p.value)
+        }
+        self._queued_count = 0
+        # Encoded /test/status responses of finished jobs (they never change)
+        self._status_cache: Dict[str, bytes] = {}
+        # Running jobs by ID, and the projects they hold. Only one job per
+        # project_path runs at a time; later jobs for a busy project wait in
+        # _deferred until finish() puts them back on the queue.
+        self.active_jobs: Dict[str, TestJob] = {}
+        self._running_projects: Set[str] = set()
+        self._deferred: Dict[str, list] = {}
+        self.total_processed = 0
         self.lock = threading.Lock()
+        self._shutdown = threading.Event()
 
     def submit(self, job: TestJob) -> bool:
         """Submit a new job to the queue"""
         try:
             with self.lock:
-                if len(self.jobs) >= MAX_QUEUE_SIZE:
+                if self._shutdown.is_set() or len(self.jobs) >= self.maxsize:
                     return False
 
                 job.submitted_at = datetime.now()
+                job.submitted_at_iso = job.submitted_at.isoformat()
                 self.jobs[job.job_id] = job
-                self.queue.put(job, block=False)
+                self.queue.put((job.priority.value, next(self._seq), job), block=False)
+                self._queued_order[job.priority][job.job_id] = job
+                self._queued_count += 1
                 logger.info(f"Job {job.job_id} submitted (task #{job.task_id})")
                 return True
         except Exception as e:
             logger.error(f"Failed to submit job: {e}")
             return False
 
-    def get_next(self, timeout: float = 1.0) -> Optional[TestJob]:
-        """Get next job from queue (blocking with timeout)"""
-        try:
-            job = self.queue.get(timeout=timeout)
+    def get_next(self) -> Optional[TestJob]:
+        """Block until the next job is available (None once shut down)"""
+        while True:
+            entry = self.queue.get()
+            job = entry[2]
+            if job is None:
+                return None
+
             with self.lock:
-                self.active_job = job
+                # Jobs cancelled while queued are skipped, not executed
+                if job.status != JobStatus.QUEUED:
+                    continue
+                if job.project_path in self._running_projects:
+                    self._deferred.setdefault(job.project_path, []).append(entry)
+                    continue
+                self._dequeue(job)
+                self._running_projects.add(job.project_path)
+                self.active_jobs[job.job_id] = job
             return job
-        except Empty:
-            return None
+
+    def finish(self, job: TestJob):
+        """Mark a job as done and release its project for the next job"""
+        with self.lock:
+            self._archive(job)
+            self.active_jobs.pop(job.job_id, None)
+            self._running_projects.discard(job.project_path)
+            self.total_processed += 1
+            # Entries keep their (priority, sequence) so order is preserved
+            for entry in self._deferred.pop(job.project_path, []):
+                self.queue.put(entry)
+
+    @property
+    def active_job(self) -> Optional[TestJob]:
+        """Longest-running active job, if any"""
+        return next(iter(self.get_active_jobs()), None)
+
+    def shutdown(self):
+        """Stop accepting jobs and wake the worker so it can exit"""
+        self._shutdown.set()
+        # Priority 0 sorts ahead of every real job
+        self.queue.put((0, -1, None))
+
+    def _archive(self, job: TestJob):
+        """Move a finished job to self.recent (caller holds the lock)"""
+        self.jobs.pop(job.job_id, None)
+        job.output = ""
+        self.recent[job.job_id] = job
+        while len(self.recent) > self.recent_limit:
+            job_id, _ = self.recent.popitem(last=False)
+            self._status_cache.pop(job_id, None)
+
+    def _dequeue(self, job: TestJob):
+        """Drop a job from the queued index (caller holds the lock)"""
+        if self._queued_order[job.priority].pop(job.job_id, None) is not None:
+            self._queued_count -= 1
 
     def get_job(self, job_id: str) -> Optional[TestJob]:
         """Get job by ID"""
         with self.lock:
-            return self.jobs.get(job_id)
+            return self.jobs.get(job_id) or self.recent.get(job_id)
 
-    def update_job(self, job: TestJob):
-        """Update job in registry"""
+    def get_cached_status(self, job_id: str) -> Optional[bytes]:
+        """Get the encoded status response of a finished job, if cached"""
+        return self._status_cache.get(job_id)
+
+    def cache_status(self, job_id: str, body: bytes):
+        """Remember the encoded status response of a finished job"""
         with self.lock:
-            self.jobs[job.job_id] = job
+            if job_id in self.recent:
+                self._status_cache[job_id] = body
 
     def cancel_job(self, job_id: str) -> bool:
         """Cancel a queued or running job"""
@@ -184,6 +318,8 @@ class JobQueue:
             if job.status == JobStatus.QUEUED:
                 job.status = JobStatus.CANCELLED
                 job.completed_at = datetime.now()
+                self._dequeue(job)
+                self._archive(job)
                 return True
 
             # Cannot cancel running jobs (would require process tracking)
@@ -192,29 +328,45 @@ class JobQueue:
     def get_queue_position(self, job_id: str) -> int:
         """Get position in queue (1-indexed)"""
         with self.lock:
-            queued_jobs = [j for j in self.jobs.values()
-                          if j.status == JobStatus.QUEUED]
-            queued_jobs.sort(key=lambda j: j.submitted_at)
-
-            for i, job in enumerate(queued_jobs, 1):
-                if job.job_id == job_id:
-                    return i
+            job = self.jobs.get(job_id)
+            if not job or job_id not in self._queued_order[job.priority]:
+                return 0
+
+            position = 1
+            for priority, bucket in self._queued_order.items():
+                if priority is job.priority:
+                    return position + next(i for i, jid in enumerate(bucket) if jid == job_id)
+                position += len(bucket)
             return 0
 
+    def get_active_jobs(self) -> List[TestJob]:
+        """Snapshot of running jobs, longest-running first"""
+        with self.lock:
+            return list(self.active_jobs.values())
+
+    def get_queued_jobs(self) -> List[TestJob]:
+        """Snapshot of queued jobs in dequeue order"""
+        with self.lock:
+            return list(itertools.chain.from_iterable(
+                bucket.values() for bucket in self._queued_order.values()))
+
     def get_queue_depth(self) -> int:
         """Get number of queued jobs"""
-        with self.lock:
-            return sum(1 for j in self.jobs.values()
-                      if j.status == JobStatus.QUEUED)
+        # Maintained under the lock by submit()/_dequeue(); reading an int
+        # needs no lock, so /health polls don't contend with submissions
+        return self._queued_count
 
     def cleanup_old_jobs(self, days: int = JOB_RETENTION_DAYS):
         """Remove jobs older than specified days"""
         cutoff = datetime.now() - timedelta(days=days)
         with self.lock:
-            old_jobs = [jid for jid, job in self.jobs.items()
-                       if job.completed_at and job.completed_at < cutoff]
-            for jid in old_jobs:
-                del self.jobs[jid]
+            # self.recent is in completion order, so old jobs are at the front
+            while self.recent:
+                jid, job = next(iter(self.recent.items()))
+                if not job.completed_at or job.completed_at >= cutoff:
+                    break
+                del self.recent[jid]
+                self._status_cache.pop(jid, None)
                 logger.info(f"Cleaned up old job {jid}")
 
 
@@ -224,7 +376,23 @@ class TestExecutor:
     def __init__(self, artifacts_dir: Path):
         self.artifacts_dir = artifacts_dir
         self.artifacts_dir.mkdir(parents=True, exist_ok=True)
-        self.current_process: Optional[subprocess.Popen] = None
+        # Resolve once so each spawn skips the $PATH search
+        self.godot_bin = shutil.which(GODOT_BIN) or GODOT_BIN
+        self._godot_version: Optional[str] = None
+
+    def godot_version(self) -> str:
+        """Get `godot --version` output (run once, then cached)"""
+        if self._godot_version is None:
+            version = "unknown"
+            try:
+                result = subprocess.run([self.godot_bin, '--version'],
+                                        capture_output=True, text=True, timeout=5)
+                if result.returncode == 0:
+                    version = result.stdout.strip()
+            except (OSError, subprocess.SubprocessError):
+                pass
+            self._godot_version = version
+        return self._godot_version
 
     def execute(self, job: TestJob) -> TestJob:
         """Execute a test job"""
@@ -240,9 +408,13 @@ class TestExecutor:
             job.completed_at = datetime.now()
             return job
 
-        # Create artifacts directory for this job
+        # Create artifacts directory for this job (the parent is created once
+        # in __init__, so a single mkdir syscall is enough)
         job_artifacts_dir = self.artifacts_dir / job.job_id
-        job_artifacts_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            os.mkdir(job_artifacts_dir)
+        except FileExistsError:
+            pass
 
         # Build command based on framework
         cmd = self._build_command(job, job_artifacts_dir)
@@ -253,24 +425,51 @@ class TestExecutor:
             job.completed_at = datetime.now()
             return job
 
-        # Execute with timeout
+        # Execute with timeout, streaming output straight to the log file
+        log_file = job_artifacts_dir / "output.log"
+        job.log_path = str(log_file)
+        tail = deque(maxlen=OUTPUT_TAIL_LINES)
+        timed_out = threading.Event()
+
         try:
             logger.info(f"Running command: {' '.join(cmd)}")
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=job.timeout_seconds,
-                cwd=job.project_path
-            )
-
-            job.output = result.stdout + result.stderr
-
-            # Save output to file
-            log_file = job_artifacts_dir / "output.log"
-            log_file.write_text(job.output)
-            job.log_path = str(log_file)
+            with open(log_file, 'w', buffering=LOG_BUFFER_SIZE) as log:
+                proc = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    # One stray byte in test output must not abort the run
+                    errors='replace',
+                    bufsize=1,
+                    cwd=job.project_path,
+                    # Own session, so the whole test process group can be
+                    # signalled without touching the server
+                    start_new_session=True
+                )
+                timer = threading.Timer(job.timeout_seconds, self._kill_on_timeout,
+                                        args=(proc, timed_out))
+                timer.start()
+                try:
+                    for line in proc.stdout:
+                        log.write(line)
+                        tail.append(line)
+                    proc.wait()
+                finally:
+                    timer.cancel()
+                    # If streaming failed, don't leave the test group running
+                    # after its slot is released
+                    if proc.poll() is None:
+                        self._signal_group(proc, signal.SIGKILL)
+                        proc.wait()
+
+            # Only the tail stays in memory; the full transcript is in output.log
+            job.output = ''.join(tail)
+            tail.clear()  # Don't hold the lines twice while parsing
+
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(cmd, job.timeout_seconds)
 
             # Parse results
             self._parse_results(job, job_artifacts_dir)
@@ -295,46 +494,73 @@ class TestExecutor:
 
         return job
 
-    def _build_command(self, job: TestJob, artifacts_dir: Path) -> Optional[List[str]]:
-        """Build Godot command based on framework"""
+    @staticmethod
+    def _kill_on_timeout(proc: subprocess.Popen, timed_out: threading.Event):
+        """Kill a test process group that exceeded its timeout
 
-        if job.framework == "gdUnit4":
-            cmd = [
-                "godot",
-                "--path", job.project_path,
-                "--headless",
-                "-s", "res://addons/gdUnit4/bin/GdUnitCmdTool.gd",
-                "--ignoreHeadlessMode"
-            ]
-
-            # Add test suite specification
-            if job.test_suite and job.test_suite != "all":
-                cmd.extend(["--test-suite", job.test_suite])
-            else:
-                cmd.extend(["-a", "test/"])
+        The whole group is signalled so helper processes (e.g. GdUnit4
+        workers) die too and release the stdout pipe.
+        """
+        if proc.poll() is not None:
+            return
+        timed_out.set()
+        TestExecutor._signal_group(proc, signal.SIGTERM)
+        try:
+            proc.wait(timeout=KILL_GRACE_SECONDS)
+        except subprocess.TimeoutExpired:
+            pass
+        # Children may outlive the leader, so always finish the group off
+        TestExecutor._signal_group(proc, signal.SIGKILL)
 
-            # Add JUnit XML output
-            junit_file = artifacts_dir / "results.xml"
-            cmd.extend(["--report-format", "junit", "--report-path", str(junit_file)])
-            job.junit_path = str(junit_file)
+    @staticmethod
+    def _signal_group(proc: subprocess.Popen, sig: int):
+        """Send a signal to the process group started for a test run"""
+        try:
+            if hasattr(os, 'killpg'):
+                os.killpg(proc.pid, sig)
+            elif sig == signal.SIGTERM:
+                proc.terminate()
+            else:
+                proc.kill()
+        except (ProcessLookupError, PermissionError):
+            pass
 
-        elif job.framework == "GUT":
-            cmd = [
-                "godot",
-                "--path", job.project_path,
-                "--headless",
-                "-s", "res://addons/gut/gut_cmdln.gd",
-                "-gdir=res://test"
-            ]
+    def _build_command(self, job: TestJob, artifacts_dir: Path) -> Optional[List[str]]:
+        """Build Godot command based on framework"""
+        builder = self._COMMAND_BUILDERS.get(job.framework)
+        if builder is None:
+            return None
+        return builder(self, job, artifacts_dir)
 
-            if job.test_suite and job.test_suite != "all":
-                cmd.append(f"-gtest={job.test_suite}")
+    def _build_gdunit4(self, job: TestJob, artifacts_dir: Path) -> List[str]:
+        """Build gdUnit4 command (writes JUnit XML to the artifacts dir)"""
+        cmd = [self.godot_bin, "--path", job.project_path, *_GDUNIT4_ARGS]
 
+        # Add test suite specification
+        if job.test_suite and job.test_suite != "all":
+            cmd.extend(("--test-suite", job.test_suite))
         else:
-            return None
+            cmd.extend(_GDUNIT4_ALL_SUITES)
 
+        # Add JUnit XML output
+        junit_file = str(artifacts_dir / "results.xml")
+        cmd.extend((*_GDUNIT4_JUNIT, junit_file))
+        job.junit_path = junit_file
         return cmd
 
+    def _build_gut(self, job: TestJob, artifacts_dir: Path) -> List[str]:
+        """Build GUT command"""
+        cmd = [self.godot_bin, "--path", job.project_path, *_GUT_ARGS]
+
+        if job.test_suite and job.test_suite != "all":
+            cmd.append(f"-gtest={job.test_suite}")
+        return cmd
+
+    _COMMAND_BUILDERS = {
+        "gdUnit4": _build_gdunit4,
+        "GUT": _build_gut,
+    }
+
     def _parse_results(self, job: TestJob, artifacts_dir: Path):
         """Parse test results"""
 
@@ -356,11 +582,16 @@ class TestExecutor:
             return
 
         try:
-            tree = ET.parse(junit_file)
-            root = tree.getroot()
+            # Only the first <testsuite> summary attributes are needed, so stop
+            # parsing there instead of building the tree for every testcase
+            testsuite = None
+            with open(junit_file, 'rb') as f:
+                for _, elem in ET.iterparse(f, events=('start',)):
+                    if elem.tag.endswith('testsuite'):
+                        testsuite = elem
+                        break
 
             # Extract summary
-            testsuite = root.find('testsuite')
             if testsuite is not None:
                 job.tests_run = int(testsuite.get('tests', 0))
                 job.tests_failed = int(testsuite.get('failures', 0)) + int(testsuite.get('errors', 0))
@@ -374,11 +605,7 @@ class TestExecutor:
 
     def _parse_gut(self, job: TestJob):
         """Parse GUT plain text output"""
-        # GUT output format: "Tests run: X  Passing: Y  Failing: Z"
-        import re
-
-        match = re.search(r'Tests run:\s*(\d+)\s+Passing:\s*(\d+)\s+Failing:\s*(\d+)',
-                         job.output)
+        match = _GUT_RE.search(job.output)
 
         if match:
             job.tests_run = int(match.group(1))
@@ -390,17 +617,9 @@ class TestExecutor:
 
     def _parse_generic(self, job: TestJob):
         """Fallback parser - look for common patterns"""
-        import re
-
         # Try to find test counts in output
-        patterns = [
-            r'(\d+)\s+tests.*(\d+)\s+passed.*(\d+)\s+failed',
-            r'Tests:\s*(\d+),\s*Passed:\s*(\d+),\s*Failed:\s*(\d+)',
-            r'PASSED.*=\s*(\d+)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, job.output, re.IGNORECASE)
+        for pattern in _GENERIC_RES:
+            match = pattern.search(job.output)
             if match:
                 if len(match.groups()) >= 3:
                     job.tests_run = int(match.group(1))
@@ -425,45 +644,163 @@ class TestExecutor:
 job_queue = JobQueue()
 executor = None  # Initialized in main()
 server_start_time = datetime.now()
-total_jobs_processed = 0
 
 
-def worker_thread():
-    """Background worker that processes jobs from queue"""
-    global total_jobs_processed
+# Callback delivery - the HTTP session and its thread pool are created on the
+# first callback so servers that never use callbacks don't import requests
+_callback_session = None
+_callback_pool: Optional[ThreadPoolExecutor] = None
+_callback_lock = threading.Lock()
 
-    logger.info("Worker thread started")
 
-    while True:
-        try:
-            # Get next job (blocks for 1 second)
-            job = job_queue.get_next(timeout=1.0)
+def _json_default(obj: Any) -> Any:
+    """Encode datetimes and enums in job payloads"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
-            if job:
-                # Execute the job
-                job = executor.execute(job)
 
-                # Update job in queue
-                job_queue.update_job(job)
+def _dumps(payload: Any) -> bytes:
+    """Encode a payload as JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(payload, default=_json_default)
+    return json.dumps(payload, default=_json_default).encode('utf-8')
 
-                total_jobs_processed += 1
 
-                # TODO: Send callback if specified
-                if job.callback_url:
-                    try:
-                        import requests
-                        requests.post(job.callback_url, json=asdict(job), timeout=5)
-                    except Exception as e:
-                        logger.error(f"Failed to send callback: {e}")
+def _json_body_response(body: bytes, status: int = 200):
+    """Wrap already-encoded JSON in a response"""
+    return app.response_class(body, status=status, mimetype='application/json')
 
-        except Exception as e:
-            logger.error(f"Worker thread error: {e}")
-            time.sleep(1)
+
+def _json_response(payload: Any, status: int = 200):
+    """Encode a payload with _dumps() and wrap it in a response"""
+    return _json_body_response(_dumps(payload), status)
+
+
+def _job_to_payload(job: TestJob) -> Dict[str, Any]:
+    """Build the callback payload for a job"""
+    return {
+        'job_id': job.job_id,
+        'project_path': job.project_path,
+        'test_suite': job.test_suite,
+        'framework': job.framework,
+        'timeout_seconds': job.timeout_seconds,
+        'agent_id': job.agent_id,
+        'task_id': job.task_id,
+        'callback_url': job.callback_url,
+        'priority': job.priority.value,
+        'status': job.status.value,
+        'submitted_at': job.submitted_at_iso,
+        'started_at': job.started_at.isoformat() if job.started_at else None,
+        'completed_at': job.completed_at.isoformat() if job.completed_at else None,
+        'result': job.result,
+        'tests_run': job.tests_run,
+        'tests_passed': job.tests_passed,
+        'tests_failed': job.tests_failed,
+        'output': job.output,
+        'error_message': job.error_message,
+        'log_path': job.log_path,
+        'junit_path': job.junit_path,
+    }
+
+
+def _get_callback_client():
+    """Get the shared callback session and pool, creating them on first use"""
+    global _callback_session, _callback_pool
+
+    with _callback_lock:
+        if _callback_session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                                  max_retries=Retry(total=2, backoff_factor=0.2))
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers['Content-Type'] = 'application/json'
+
+            _callback_session = session
+            _callback_pool = ThreadPoolExecutor(max_workers=CALLBACK_WORKERS,
+                                                thread_name_prefix='callback')
+
+        return _callback_session, _callback_pool
+
+
+def _post_callback(session, job_id: str, url: str, body: bytes):
+    """POST a job result to its callback URL"""
+    try:
+        response = session.post(url, data=body, timeout=CALLBACK_TIMEOUT)
+        if response.status_code >= 400:
+            logger.warning(f"Callback for job {job_id} returned {response.status_code}")
+    except Exception as e:
+        logger.error(f"Failed to send callback for job {job_id}: {e}")
+
+
+def send_callback(job: TestJob):
+    """Queue the job result for delivery to job.callback_url"""
+    try:
+        # Serialize now so later changes to the job don't race the POST
+        body = _dumps(_job_to_payload(job))
+        session, pool = _get_callback_client()
+        pool.submit(_post_callback, session, job.job_id, job.callback_url, body)
+    except Exception as e:
+        logger.error(f"Failed to send callback: {e}")
+
+
+def run_job(job: TestJob):
+    """Execute a job on a pool thread and record the result"""
+    try:
+        job = executor.execute(job)
+    except Exception as e:
+        logger.error(f"Worker error on job {job.job_id}: {e}")
+        job.status = JobStatus.FAILED
+        job.error_message = str(e)
+        job.completed_at = datetime.now()
+
+    try:
+        # Send callback if specified (serialized now, delivered in the
+        # background) - before finish() drops the output from memory
+        if job.callback_url:
+            send_callback(job)
+    finally:
+        # Always release the project, or its queued jobs would never run
+        job_queue.finish(job)
+
+
+def worker_thread(max_workers: int = 1):
+    """Background dispatcher that runs queued jobs on a pool of threads"""
+    logger.info(f"Worker thread started ({max_workers} worker(s))")
+
+    # A slot is taken before dequeuing, so jobs stay in the priority queue
+    # (and stay cancellable) until a worker is actually free
+    slots = threading.BoundedSemaphore(max_workers)
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='test-worker') as pool:
+        while True:
+            slots.acquire()
+            try:
+                # Get next job (blocks until one is submitted)
+                job = job_queue.get_next()
+
+                if job is None:
+                    logger.info("Worker thread stopping")
+                    break
+
+                future = pool.submit(run_job, job)
+                future.add_done_callback(lambda _: slots.release())
+
+            except Exception as e:
+                slots.release()
+                logger.error(f"Worker thread error: {e}")
+                time.sleep(1)
 
 
 # API Endpoints
 
-@app.route('/test/submit', methods=['POST'])
 def submit_test():
     """Submit a new test job"""
     try:
@@ -473,17 +810,26 @@ def submit_test():
         if not data.get('project_path'):
             return jsonify({'error': 'project_path is required'}), 400
 
+        # Reject bad input before it takes a queue slot
+        priority = _PRIORITY_BY_NAME.get(data.get('priority', 'NORMAL'))
+        if priority is None:
+            return jsonify({'error': f"Invalid priority: {data.get('priority')}"}), 400
+
+        framework = data.get('framework', 'gdUnit4')
+        if framework not in TestExecutor._COMMAND_BUILDERS:
+            return jsonify({'error': f"Unsupported framework: {framework}"}), 400
+
         # Create job
         job = TestJob(
-            job_id=str(uuid.uuid4()),
+            job_id=uuid.uuid4().hex,
             project_path=data['project_path'],
             test_suite=data.get('test_suite', 'all'),
-            framework=data.get('framework', 'gdUnit4'),
+            framework=framework,
             timeout_seconds=data.get('timeout_seconds', DEFAULT_TIMEOUT),
             agent_id=data.get('agent_id'),
             task_id=data.get('task_id'),
             callback_url=data.get('callback_url'),
-            priority=Priority[data.get('priority', 'NORMAL')]
+            priority=priority
         )
 
         # Submit to queue
@@ -506,9 +852,13 @@ def submit_test():
         return jsonify({'error': str(e)}), 500
 
 
-@app.route('/test/status/<job_id>', methods=['GET'])
 def get_status(job_id: str):
     """Get job status"""
+    # Finished jobs are immutable, so repeat polls reuse the encoded response
+    cached = job_queue.get_cached_status(job_id)
+    if cached is not None:
+        return _json_body_response(cached)
+
     job = job_queue.get_job(job_id)
 
     if not job:
@@ -517,7 +867,7 @@ def get_status(job_id: str):
     response = {
         'job_id': job.job_id,
         'status': job.status.value,
-        'submitted_at': job.submitted_at.isoformat() if job.submitted_at else None,
+        'submitted_at': job.submitted_at_iso,
     }
 
     if job.status == JobStatus.QUEUED:
@@ -553,10 +903,15 @@ def get_status(job_id: str):
         if job.error_message:
             response['error_message'] = job.error_message
 
-    return jsonify(response)
+    body = _dumps(response)
+
+    # completed_at is the last field set on every transition into a final state
+    if job.status in FINAL_STATUSES and job.completed_at:
+        job_queue.cache_status(job_id, body)
+
+    return _json_body_response(body)
 
 
-@app.route('/test/results/<job_id>', methods=['GET'])
 def get_results(job_id: str):
     """Get detailed test results"""
     job = job_queue.get_job(job_id)
@@ -567,7 +922,7 @@ def get_results(job_id: str):
     if job.status not in [JobStatus.COMPLETE, JobStatus.FAILED]:
         return jsonify({'error': 'Job not complete'}), 400
 
-    return jsonify({
+    return _json_response({
         'job_id': job.job_id,
         'result': job.result,
         'summary': {
@@ -575,15 +930,30 @@ def get_results(job_id: str):
             'passed': job.tests_passed,
             'failed': job.tests_failed,
         },
-        'output': job.output,
+        # The transcript can be many MB; clients fetch it from log_url
         'artifacts': {
             'log': job.log_path,
+            'log_url': f"{request.host_url}test/artifacts/{job.job_id}/log" if job.log_path else None,
             'junit': job.junit_path
         }
     })
 
 
-@app.route('/test/cancel/<job_id>', methods=['DELETE'])
+def get_log(job_id: str):
+    """Stream a job's full output log"""
+    job = job_queue.get_job(job_id)
+
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+
+    if not job.log_path or not os.path.isfile(job.log_path):
+        return jsonify({'error': 'Log not available'}), 404
+
+    # send_file streams from disk (sendfile where the server supports it)
+    # and answers If-None-Match / If-Modified-Since with 304
+    return send_file(job.log_path, mimetype='text/plain', conditional=True)
+
+
 def cancel_test(job_id: str):
     """Cancel a queued or running test"""
     if job_queue.cancel_job(job_id):
@@ -596,71 +966,90 @@ def cancel_test(job_id: str):
         return jsonify({'error': 'Cannot cancel job (not found or already running)'}), 400
 
 
-@app.route('/health', methods=['GET'])
 def health():
     """Health check endpoint"""
     uptime = (datetime.now() - server_start_time).total_seconds()
-
-    # Get Godot version
-    godot_version = "unknown"
-    try:
-        result = subprocess.run(['godot', '--version'],
-                              capture_output=True, text=True, timeout=5)
-        if result.returncode == 0:
-            godot_version = result.stdout.strip()
-    except:
-        pass
+    # One snapshot, so both fields agree while workers finish jobs
+    active = job_queue.get_active_jobs()
 
     return jsonify({
         'status': 'healthy',
-        'godot_version': godot_version,
+        'godot_version': executor.godot_version(),
         'uptime_seconds': int(uptime),
         'queue_depth': job_queue.get_queue_depth(),
-        'active_job': job_queue.active_job.job_id if job_queue.active_job else None,
-        'total_jobs_processed': total_jobs_processed,
+        'active_job': active[0].job_id if active else None,
+        'active_jobs': [job.job_id for job in active],
+        'total_jobs_processed': job_queue.total_processed,
     })
 
 
-@app.route('/queue', methods=['GET'])
 def view_queue():
     """View current queue"""
-    active = None
-    if job_queue.active_job:
-        job = job_queue.active_job
-        active = {
+    running = []
+    for job in job_queue.get_active_jobs():
+        info = {
             'job_id': job.job_id,
             'agent_id': job.agent_id,
             'task_id': job.task_id,
+            'project_path': job.project_path,
             'started_at': job.started_at.isoformat() if job.started_at else None,
         }
         if job.started_at:
-            active['elapsed_seconds'] = int((datetime.now() - job.started_at).total_seconds())
-
-    queued_jobs = []
-    with job_queue.lock:
-        queued = [j for j in job_queue.jobs.values() if j.status == JobStatus.QUEUED]
-        queued.sort(key=lambda j: j.submitted_at)
-
-        for i, job in enumerate(queued, 1):
-            queued_jobs.append({
-                'job_id': job.job_id,
-                'agent_id': job.agent_id,
-                'task_id': job.task_id,
-                'position': i,
-                'submitted_at': job.submitted_at.isoformat() if job.submitted_at else None,
-            })
+            info['elapsed_seconds'] = int((datetime.now() - job.started_at).total_seconds())
+        running.append(info)
 
-    return jsonify({
-        'active': active,
+    # Already in dequeue order; the lock is only held for the snapshot
+    queued_jobs = [{
+        'job_id': job.job_id,
+        'agent_id': job.agent_id,
+        'task_id': job.task_id,
+        'position': i,
+        'submitted_at': job.submitted_at_iso,
+    } for i, job in enumerate(job_queue.get_queued_jobs(), 1)]
+
+    return _json_response({
+        'active': running[0] if running else None,
+        'running': running,
         'queued': queued_jobs,
         'total_queued': len(queued_jobs)
     })
 
 
+def _load_flask():
+    """Import Flask on first use"""
+    global Flask, request, jsonify, send_file
+
+    try:
+        from flask import Flask, request, jsonify, send_file
+    except ImportError:
+        print("Error: Required packages not installed")
+        print("Install: pip3 install flask")
+        sys.exit(1)
+
+
+def _register_routes(flask_app):
+    """Attach API endpoints to the Flask app"""
+    flask_app.add_url_rule('/test/submit', view_func=submit_test, methods=['POST'])
+    flask_app.add_url_rule('/test/status/<job_id>', view_func=get_status, methods=['GET'])
+    flask_app.add_url_rule('/test/results/<job_id>', view_func=get_results, methods=['GET'])
+    flask_app.add_url_rule('/test/artifacts/<job_id>/log', view_func=get_log, methods=['GET'])
+    flask_app.add_url_rule('/test/cancel/<job_id>', view_func=cancel_test, methods=['DELETE'])
+    flask_app.add_url_rule('/health', view_func=health, methods=['GET'])
+    flask_app.add_url_rule('/queue', view_func=view_queue, methods=['GET'])
+
+
+def create_app():
+    """Create the Flask app with all routes registered"""
+    _load_flask()
+    flask_app = Flask(__name__)
+    _register_routes(flask_app)
+    return flask_app
+
+
 def main():
     """Main entry point"""
     import argparse
-    global executor
+    global app, executor
 
     parser = argparse.ArgumentParser(description='Godot Test Coordination Server')
     parser.add_argument('--host', default='127.0.0.1',
@@ -669,24 +1058,60 @@ def main():
                        help='Port to listen on (default: 5000)')
     parser.add_argument('--artifacts-dir', default=DEFAULT_ARTIFACTS_DIR,
                        help=f'Directory for test artifacts (default: {DEFAULT_ARTIFACTS_DIR})')
+    parser.add_argument('--max-workers', type=int, default=1,
+                       help='Jobs to run in parallel, one per project (default: 1)')
+    parser.add_argument('--server', choices=['auto', 'waitress', 'flask'], default='auto',
+                       help='HTTP server to use (default: auto - waitress if installed)')
     parser.add_argument('--debug', action='store_true',
                        help='Enable debug mode')
 
     args = parser.parse_args()
 
+    app = create_app()
+
     # Initialize executor with artifacts directory
     artifacts_path = Path(args.artifacts_dir)
     executor = TestExecutor(artifacts_path)
+    logger.info(f"Godot: {executor.godot_bin} ({executor.godot_version()})")
 
     # Start worker thread
-    worker = threading.Thread(target=worker_thread, daemon=True)
+    worker = threading.Thread(target=worker_thread, args=(max(1, args.max_workers),),
+                              daemon=True)
     worker.start()
+    atexit.register(job_queue.shutdown)
 
-    # Start Flask server
     logger.info(f"Starting Godot Server on {args.host}:{args.port}")
     logger.info(f"Artifacts directory: {artifacts_path}")
 
-    app.run(host=args.host, port=args.port, debug=args.debug, threaded=True)
+    run_http_server(args.host, args.port, server=args.server, debug=args.debug)
+
+
+def run_http_server(host: str, port: int, server: str = 'auto', debug: bool = False):
+    """
+    Serve the API over HTTP
+
+    waitress keeps idle keep-alive connections in its socket loop and only
+    hands requests to its thread pool while they run, so many agents polling
+    /test/status don't pin one OS thread each. The job queue lives in this
+    process, so only a single server process is ever started. Falls back to
+    Flask's threaded server when waitress is unavailable or in debug mode.
+    """
+    if server != 'flask' and not debug:
+        try:
+            from waitress import serve
+        except ImportError:
+            if server == 'waitress':
+                logger.error("waitress not installed. Install with: pip3 install waitress")
+                sys.exit(1)
+            logger.warning("waitress not installed, falling back to Flask development server")
+        else:
+            logger.info(f"Serving with waitress ({SERVER_THREADS} thread(s))")
+            serve(app, host=host, port=port, threads=SERVER_THREADS,
+                  channel_timeout=KEEP_ALIVE_SECONDS, clear_untrusted_proxy_headers=True,
+                  ident='godot-server')
+            return
+
+    app.run(host=host, port=port, debug=debug, threaded=True)
 
 
 if __name__ == '__main__':
@@ -3,16 +3,34 @@
 Lazy_Bird Issue Watcher Service
 Polls GitHub/GitLab for issues labeled 'ready' and queues them for processing
 Phase 1.1: Multi-project support
+
+Optional webhook mode (config 'webhook: {enabled: true}') receives GitHub
+'issues' events / GitLab 'Issue Hook' events as they happen; polling then
+only runs as a slow reconciliation pass.
 """
 
+import re
 import time
 import sys
 import json
+import hmac
+import hashlib
 import logging
+import atexit
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Set
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+try:
+    import orjson
+except ImportError:  # Optional - falls back to the stdlib json module
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -22,6 +40,140 @@ logging.basicConfig(
 )
 logger = logging.getLogger('issue-watcher')
 
+SECRETS_DIR = Path.home() / '.config' / 'lazy_birtd' / 'secrets'
+DATA_DIR = Path.home() / '.config' / 'lazy_birtd' / 'data'
+PROCESSED_LOG = DATA_DIR / 'processed_issues.log'  # One issue key per line, append-only
+DEFAULT_WEBHOOK_PORT = 8787
+DEFAULT_WEBHOOK_HOST = '127.0.0.1'  # Expose through a reverse proxy or an explicit host
+WEBHOOK_THREADS = 4  # waitress request threads for webhook deliveries
+WEBHOOK_POLL_INTERVAL = 600  # Reconciliation poll when webhooks deliver events
+FETCH_WORKERS = 8  # Concurrent per-project fetches during a poll
+RATE_LIMIT_MIN_REMAINING = 100  # Pause GitHub polls below this many requests left
+GITHUB_MAX_CONCURRENT = 4  # In-flight GitHub requests per token
+GITHUB_WRITE_INTERVAL = 1.0  # GitHub asks for >= 1s between content-changing requests
+GITHUB_BACKOFF_ATTEMPTS = 6  # Secondary rate limit retries: 1, 2, 4, 8, 16, 32s
+
+# Markdown issue bodies: '## Header' lines and the list items under them.
+# [^\S\n] is str.strip()'s whitespace (Unicode included) without crossing lines.
+_SECTION_RE = re.compile(r'^[^\S\n]*#{2,}[^\S\n]*(.*?)[^\S\n]*$', re.MULTILINE)
+_ITEM_RE = re.compile(r'^[^\S\n]*((?:[1-9][0-9]*\.|[-*]|\[[ x]\])[^\n]*?)[^\S\n]*$',
+                      re.MULTILINE)
+
+GITHUB_GRAPHQL_URL = 'https://api.github.com/graphql'
+# Only the fields parse_issue needs; PRs are not part of 'issues' in GraphQL
+GRAPHQL_ISSUES_FIELDS = (
+    'issues(first: 100, states: OPEN, labels: ["ready"], '
+    'orderBy: {field: CREATED_AT, direction: ASC}) '
+    '{ nodes { number title body url createdAt labels(first: 20) { nodes { name } } } }'
+)
+
+
+def _dumps(payload: Dict) -> bytes:
+    """Encode a payload as compact JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(',', ':')).encode('utf-8')
+
+
+class GitHubThrottle:
+    """Paces GitHub API calls made with one token
+
+    Label writes go ahead of waiting reads and are spaced
+    GITHUB_WRITE_INTERVAL apart. A secondary rate limit (403/429) makes
+    every caller on the token back off, not just the one that hit it.
+    """
+
+    _by_token: Dict[str, 'GitHubThrottle'] = {}
+    _registry_lock = threading.Lock()
+
+    @classmethod
+    def for_token(cls, token: str) -> 'GitHubThrottle':
+        """Get the throttle shared by all projects using a token"""
+        with cls._registry_lock:
+            if token not in cls._by_token:
+                cls._by_token[token] = cls()
+            return cls._by_token[token]
+
+    def __init__(self):
+        self._slots = threading.BoundedSemaphore(GITHUB_MAX_CONCURRENT)
+        self._cond = threading.Condition()
+        self._writers_waiting = 0
+        self._next_write = 0.0
+        self._blocked_until = 0.0
+
+    def request(self, session: requests.Session, method: str, url: str,
+                write: bool = False, **kwargs) -> requests.Response:
+        """Send a request through the throttle, retrying secondary rate limits"""
+        for attempt in range(GITHUB_BACKOFF_ATTEMPTS):
+            self._wait_turn(write)
+            try:
+                response = session.request(method, url, **kwargs)
+            finally:
+                self._slots.release()
+
+            delay = self._backoff_delay(response, attempt)
+            if delay is None or attempt == GITHUB_BACKOFF_ATTEMPTS - 1:
+                return response
+
+            logger.warning(f"GitHub secondary rate limit hit, backing off {delay}s")
+            with self._cond:
+                self._blocked_until = max(self._blocked_until, time.time() + delay)
+                self._cond.notify_all()
+
+        return response
+
+    def _wait_turn(self, write: bool):
+        """Block until backoff has passed and no write is ahead of a read"""
+        with self._cond:
+            if write:
+                self._writers_waiting += 1
+            while True:
+                now = time.time()
+                ready_at = max(self._blocked_until, self._next_write if write else 0.0)
+                if ready_at > now:
+                    self._cond.wait(ready_at - now)
+                elif not write and self._writers_waiting:
+                    self._cond.wait()
+                else:
+                    break
+            if write:
+                self._writers_waiting -= 1
+                self._next_write = now + GITHUB_WRITE_INTERVAL
+                self._cond.notify_all()
+
+        self._slots.acquire()
+
+    @staticmethod
+    def _backoff_delay(response: requests.Response, attempt: int) -> Optional[int]:
+        """Seconds to wait before retrying, or None if the response should stand
+
+        Exhausting the primary quota (remaining == 0) is not retried here;
+        polls pause until the reset via ProjectWatcher.track_rate_limit().
+        """
+        if response.status_code not in (403, 429):
+            return None
+        retry_after = response.headers.get('Retry-After')
+        if retry_after:
+            return GitHubThrottle._retry_after_seconds(retry_after, attempt)
+        if response.headers.get('X-RateLimit-Remaining') == '0':
+            return None
+        if 'secondary rate limit' in response.text.lower():
+            return 2 ** attempt
+        return None
+
+    @staticmethod
+    def _retry_after_seconds(retry_after: str, attempt: int) -> int:
+        """Parse a Retry-After header (delay in seconds or an HTTP-date)"""
+        if retry_after.isdigit():
+            return int(retry_after)
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return 2 ** attempt
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0, int((retry_at - datetime.now(timezone.utc)).total_seconds()) + 1)
+
 
 class ProjectWatcher:
     """Monitors a single project's GitHub/GitLab for ready-to-process issues"""
@@ -41,15 +193,49 @@ class ProjectWatcher:
         self.platform = project_config['git_platform']
         self.repository = project_config['repository']
 
+        # Parse owner/repo from repository URL or string once
+        repo_parts = self.repository.rstrip('/').split('/')
+        self.owner = repo_parts[-2] if len(repo_parts) > 1 else ''
+        self.repo = repo_parts[-1]
+        self.repo_full = f"{self.owner}/{self.repo}"
+
+        # Request targets are constant per project
+        self._gh_issues_url = f"https://api.github.com/repos/{self.repo_full}/issues"
+        self._gh_params = {
+            'labels': 'ready',
+            'state': 'open',
+            'sort': 'created',
+            'direction': 'asc'
+        }
+        self._gl_params = {
+            'labels': 'ready',
+            'state': 'opened',
+            'order_by': 'created_at',
+            'sort': 'asc'
+        }
+
+        # GitLab project ID from config, or looked up once on first fetch
+        self.gitlab_project_id = project_config.get('project_id')
+
         # Load API token (project-specific or shared)
         self.token = self.load_token()
 
+        # One pooled session per project so polls reuse the TLS connection
+        self.session = self.create_session()
+        atexit.register(self.session.close)
+        self.github = GitHubThrottle.for_token(self.token) if self.platform == 'github' else None
+
+        # Conditional-request state: a 304 reuses the last issue list for free
+        self._etag = None
+        self._issues: List[Dict] = []
+        self.paused_until = 0.0
+
         logger.info(f"  [{self.project_id}] {self.project_name} ({self.project_type})")
         logger.info(f"    Repository: {self.repository}")
 
     def load_token(self) -> str:
         """Load API token from secrets directory"""
-        secrets_dir = Path.home() / '.config' / 'lazy_birtd' / 'secrets'
+        secrets_dir = SECRETS_DIR
 
         # Try project-specific token first
         token_file = secrets_dir / f'{self.project_id}_token'
@@ -75,6 +261,26 @@ class ProjectWatcher:
             logger.error(f"[{self.project_id}] Failed to read token: {e}")
             raise
 
+    def create_session(self) -> requests.Session:
+        """Create a keep-alive session with auth headers and retries"""
+        session = requests.Session()
+        # GitHub 429s are left to GitHubThrottle, which backs off every caller
+        # on the token instead of sleeping inside one request's slot
+        status_forcelist = [502, 503, 504] if self.platform == 'github' else [429, 502, 503, 504]
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                              max_retries=Retry(total=5, backoff_factor=1,
+                                                status_forcelist=status_forcelist))
+        session.mount('https://', adapter)
+
+        if self.platform == 'github':
+            session.headers.update({
+                'Authorization': f'token {self.token}',
+                'Accept': 'application/vnd.github.v3+json'
+            })
+        elif self.platform == 'gitlab':
+            session.headers['PRIVATE-TOKEN'] = self.token
+        return session
+
     def fetch_ready_issues(self) -> List[Dict]:
         """Fetch issues with 'ready' label from GitHub/GitLab"""
         try:
@@ -94,74 +300,74 @@ class ProjectWatcher:
 
     def fetch_github_issues(self) -> List[Dict]:
         """Fetch from GitHub API"""
-        # Parse owner/repo from repository URL or string
-        repo_parts = self.repository.rstrip('/').split('/')
-        owner = repo_parts[-2]
-        repo = repo_parts[-1]
+        # Rate limit nearly used up: skip polling until it resets
+        if time.time() < self.paused_until:
+            return self._issues
 
-        url = f"https://api.github.com/repos/{owner}/{repo}/issues"
-        headers = {
-            'Authorization': f'token {self.token}',
-            'Accept': 'application/vnd.github.v3+json'
-        }
-        params = {
-            'labels': 'ready',
-            'state': 'open',
-            'sort': 'created',
-            'direction': 'asc'
-        }
+        headers = {'If-None-Match': self._etag} if self._etag else {}
+        response = self.github.request(self.session, 'GET', self._gh_issues_url,
+                                       params=self._gh_params, headers=headers, timeout=30)
+        self.track_rate_limit(response)
+
+        # Not modified since the last poll (doesn't count against the quota)
+        if response.status_code == 304:
+            return self._issues
 
-        response = requests.get(url, headers=headers, params=params, timeout=30)
         response.raise_for_status()
 
-        issues = []
-        for issue in response.json():
-            # Skip pull requests (they appear as issues in GitHub API)
-            if 'pull_request' in issue:
-                continue
+        # Skip pull requests (they appear as issues in GitHub API)
+        self._issues = [self.github_issue(issue) for issue in response.json()
+                        if 'pull_request' not in issue]
+        self._etag = response.headers.get('ETag')
+        return self._issues
+
+    def track_rate_limit(self, response: requests.Response):
+        """Pause GitHub polls when the rate limit is low or exceeded"""
+        now = time.time()
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+
+        # Still rate limited after the throttle's last attempt: pause for the
+        # delay it would have waited next
+        backoff = GitHubThrottle._backoff_delay(response, GITHUB_BACKOFF_ATTEMPTS - 1)
+        if backoff is not None:
+            self.paused_until = now + backoff
+        elif remaining is not None and reset and int(remaining) < RATE_LIMIT_MIN_REMAINING:
+            self.paused_until = float(reset)
+        else:
+            return
 
-            issues.append({
-                'id': issue['number'],
-                'title': issue['title'],
-                'body': issue['body'] or '',
-                'labels': [l['name'] for l in issue['labels']],
-                'url': issue['html_url'],
-                'created_at': issue['created_at']
-            })
+        logger.warning(f"[{self.project_id}] GitHub rate limit low ({remaining} left), "
+                       f"pausing polls for {max(0, int(self.paused_until - now))}s")
 
-        return issues
+    @staticmethod
+    def github_issue(issue: Dict) -> Dict:
+        """Convert a GitHub API / webhook issue object to the watcher format"""
+        return {
+            'id': issue['number'],
+            'title': issue['title'],
+            'body': issue['body'] or '',
+            'labels': [l['name'] for l in issue['labels']],
+            'url': issue['html_url'],
+            'created_at': issue['created_at']
+        }
 
     def fetch_gitlab_issues(self) -> List[Dict]:
         """Fetch from GitLab API"""
-        # Get project ID from config or parse from URL
-        project_id = self.project_config.get('project_id')
-
-        if not project_id:
-            # Try to get project ID from API using project path
-            project_path = self.repository.rstrip('/').split('/')[-2:]
-            project_path_str = '/'.join(project_path)
-
-            url = f"https://gitlab.com/api/v4/projects/{requests.utils.quote(project_path_str, safe='')}"
-            headers = {'PRIVATE-TOKEN': self.token}
+        if not self.gitlab_project_id:
+            # Try to get project ID from API using project path (cached after)
+            url = f"https://gitlab.com/api/v4/projects/{requests.utils.quote(self.repo_full, safe='')}"
 
             try:
-                response = requests.get(url, headers=headers, timeout=30)
+                response = self.session.get(url, timeout=30)
                 response.raise_for_status()
-                project_id = response.json()['id']
+                self.gitlab_project_id = response.json()['id']
             except Exception as e:
                 logger.error(f"[{self.project_id}] Failed to get GitLab project ID: {e}")
                 return []
 
-        url = f"https://gitlab.com/api/v4/projects/{project_id}/issues"
-        headers = {'PRIVATE-TOKEN': self.token}
-        params = {
-            'labels': 'ready',
-            'state': 'opened',
-            'order_by': 'created_at',
-            'sort': 'asc'
-        }
-
-        response = requests.get(url, headers=headers, params=params, timeout=30)
+        url = f"https://gitlab.com/api/v4/projects/{self.gitlab_project_id}/issues"
+        response = self.session.get(url, params=self._gl_params, timeout=30)
         response.raise_for_status()
 
         issues = []
@@ -222,31 +428,11 @@ class ProjectWatcher:
 
     def parse_markdown_sections(self, body: str) -> Dict[str, List[str]]:
         """Parse markdown body into sections"""
-        sections = {}
-        current_section = None
-        current_content = []
-
-        for line in body.split('\n'):
-            # Check for section headers (## Header)
-            if line.strip().startswith('##'):
-                # Save previous section
-                if current_section:
-                    sections[current_section] = current_content
-
-                # Start new section
-                current_section = line.strip().lstrip('#').strip()
-                current_content = []
-            elif current_section:
-                # Add content to current section
-                stripped = line.strip()
-                if stripped and (stripped.startswith(('1.', '2.', '3.', '4.', '5.', '6.', '7.', '8.', '9.', '-', '*', '[ ]', '[x]'))):
-                    current_content.append(stripped)
-
-        # Save last section
-        if current_section:
-            sections[current_section] = current_content
-
-        return sections
+        # split() alternates [preamble, header, content, header, content, ...]
+        parts = _SECTION_RE.split(body)
+        # A bare '##' has no name and just ends the previous section
+        return {parts[i]: _ITEM_RE.findall(parts[i + 1])
+                for i in range(1, len(parts), 2) if parts[i]}
 
     def update_issue_labels(self, issue: Dict):
         """Remove 'ready' label and add 'in-queue' label"""
@@ -259,51 +445,29 @@ class ProjectWatcher:
             logger.error(f"[{self.project_id}] Failed to update labels for issue #{issue['id']}: {e}")
 
     def update_github_labels(self, issue: Dict):
-        """Update GitHub issue labels using gh CLI"""
-        import subprocess
-
-        repo_parts = self.repository.rstrip('/').split('/')
-        owner = repo_parts[-2]
-        repo = repo_parts[-1]
-        repo_name = f"{owner}/{repo}"
-
-        try:
-            # Remove 'ready' label using gh CLI
-            result = subprocess.run(
-                ['gh', 'issue', 'edit', str(issue['id']), '--repo', repo_name, '--remove-label', 'ready'],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            if result.returncode != 0:
-                logger.warning(f"[{self.project_id}] Failed to remove 'ready' label: {result.stderr}")
-
-            # Add 'in-queue' label using gh CLI
-            result = subprocess.run(
-                ['gh', 'issue', 'edit', str(issue['id']), '--repo', repo_name, '--add-label', 'in-queue'],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            if result.returncode != 0:
-                logger.warning(f"[{self.project_id}] Failed to add 'in-queue' label: {result.stderr}")
-            else:
-                logger.info(f"[{self.project_id}] ✅ Labels updated: ready → in-queue")
-
-        except subprocess.TimeoutExpired:
-            logger.error(f"[{self.project_id}] Timeout updating labels via gh CLI")
-        except Exception as e:
-            logger.error(f"[{self.project_id}] Error updating labels: {e}")
+        """Update GitHub issue labels with one PATCH on the pooled session"""
+        # Labels are already known from the fetch/webhook, so replace the
+        # whole set atomically instead of a remove + add round-trip
+        labels = [l for l in issue['labels'] if l != 'ready']
+        if 'in-queue' not in labels:
+            labels.append('in-queue')
+
+        url = f"{self._gh_issues_url}/{issue['id']}"
+        response = self.github.request(self.session, 'PATCH', url, write=True,
+                                       json={'labels': labels}, timeout=30)
+
+        if response.status_code != 200:
+            logger.warning(f"[{self.project_id}] Failed to update GitHub labels: {response.status_code}")
+        else:
+            logger.info(f"[{self.project_id}] ✅ Labels updated: ready → in-queue")
 
     def update_gitlab_labels(self, issue: Dict):
         """Update GitLab issue labels"""
-        project_id = self.project_config.get('project_id')
+        project_id = self.gitlab_project_id
         if not project_id:
-            logger.warning(f"[{self.project_id}] GitLab project_id not configured, cannot update labels")
+            logger.warning(f"[{self.project_id}] GitLab project_id not known, cannot update labels")
             return
 
-        headers = {'PRIVATE-TOKEN': self.token}
-
         # Get current labels
         current_labels = [l for l in issue['labels'] if l != 'ready']
         current_labels.append('processing')
@@ -311,7 +475,7 @@ class ProjectWatcher:
         # Update issue with new labels
         url = f"https://gitlab.com/api/v4/projects/{project_id}/issues/{issue['id']}"
         data = {'labels': ','.join(current_labels)}
-        response = requests.put(url, headers=headers, json=data, timeout=30)
+        response = self.session.put(url, json=data, timeout=30)
 
         if response.status_code not in [200, 201]:
             logger.warning(f"[{self.project_id}] Failed to update GitLab labels: {response.status_code}")
@@ -325,14 +489,29 @@ class IssueWatcher:
         self.config_path = config_path
         self.config = self.load_config()
 
-        # Polling configuration
-        self.poll_interval = self.config.get('poll_interval_seconds', 60)
+        # Webhook configuration (optional)
+        self.webhook_config = self.config.get('webhook') or {}
+        self.webhook_enabled = bool(self.webhook_config.get('enabled', False))
+
+        # Polling configuration; with webhooks polling is only a safety net
+        if self.webhook_enabled:
+            self.poll_interval = self.webhook_config.get('poll_interval_seconds', WEBHOOK_POLL_INTERVAL)
+        else:
+            self.poll_interval = self.config.get('poll_interval_seconds', 60)
 
         # Load projects
         self.project_watchers = self.load_projects()
 
-        # State management (per-project)
+        # Polls fetch every project at once; a poll takes max(RTT), not sum(RTT)
+        self.fetch_pool = ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(self.project_watchers)),
+                                             thread_name_prefix='fetch')
+
+        # State management (per-project); shared by the poll loop and webhook thread
         self.processed_issues = self.load_processed_issues()
+        self.lock = threading.Lock()
+
+        # Task queue directory, created once
+        self.queue_dir = self.resolve_queue_dir()
 
         logger.info(f"Issue Watcher initialized (Phase 1.1 Multi-Project)")
         logger.info(f"  Monitoring {len(self.project_watchers)} project(s)")
@@ -430,33 +609,59 @@ class IssueWatcher:
         return watchers
 
     def load_processed_issues(self) -> Set[str]:
-        """Load set of already-processed issue IDs (format: project-id:issue-number)"""
-        data_dir = Path.home() / '.config' / 'lazy_birtd' / 'data'
-        data_dir.mkdir(parents=True, exist_ok=True)
+        """Load set of already-processed issue IDs (format: project-id:issue-number)
+
+        IDs are kept in an append-only log; a legacy processed_issues.json
+        is folded into it on first start.
+        """
+        DATA_DIR.mkdir(parents=True, exist_ok=True)
+        processed = set()
+        log_lines = 0
 
-        processed_file = data_dir / 'processed_issues.json'
-        if processed_file.exists():
+        legacy_file = DATA_DIR / 'processed_issues.json'
+        if legacy_file.exists() and not PROCESSED_LOG.exists():
             try:
-                data = json.loads(processed_file.read_text())
-                return set(data)
+                processed.update(json.loads(legacy_file.read_text()))
             except Exception as e:
                 logger.warning(f"Failed to load processed issues: {e}")
-                return set()
-        return set()
 
-    def save_processed_issues(self):
-        """Save processed issue IDs to disk"""
-        data_dir = Path.home() / '.config' / 'lazy_birtd' / 'data'
-        data_dir.mkdir(parents=True, exist_ok=True)
+        if PROCESSED_LOG.exists():
+            try:
+                with open(PROCESSED_LOG) as f:
+                    for line in f:
+                        key = line.strip()
+                        if key:
+                            processed.add(key)
+                            log_lines += 1
+            except Exception as e:
+                logger.warning(f"Failed to load processed issues: {e}")
+
+        # Rewrite the log when it is mostly duplicates or misses migrated IDs
+        if log_lines > 2 * len(processed) or log_lines < len(processed):
+            self.compact_processed_issues(processed)
+
+        self._processed_fp = open(PROCESSED_LOG, 'a', buffering=1)
+        atexit.register(self._processed_fp.close)
+        return processed
 
-        processed_file = data_dir / 'processed_issues.json'
+    def compact_processed_issues(self, processed: Set[str]):
+        """Replace the processed-issues log with one line per ID"""
+        tmp_file = PROCESSED_LOG.with_suffix('.tmp')
         try:
-            processed_file.write_text(json.dumps(list(self.processed_issues), indent=2))
+            tmp_file.write_text(''.join(f"{key}\n" for key in sorted(processed)))
+            tmp_file.replace(PROCESSED_LOG)
+        except Exception as e:
+            logger.error(f"Failed to compact processed issues: {e}")
+
+    def save_processed_issues(self, issue_key: str):
+        """Append a processed issue ID to disk"""
+        try:
+            self._processed_fp.write(f"{issue_key}\n")
         except Exception as e:
             logger.error(f"Failed to save processed issues: {e}")
 
-    def queue_task(self, parsed_issue: Dict, project_watcher: ProjectWatcher):
-        """Add task to processing queue with project context"""
+    def resolve_queue_dir(self) -> Path:
+        """Pick and create the task queue directory"""
         queue_dir = Path('/var/lib/lazy_birtd/queue')
 
         # Create queue directory if it doesn't exist
@@ -468,20 +673,173 @@ class IssueWatcher:
             queue_dir.mkdir(parents=True, exist_ok=True)
             logger.warning(f"Using fallback queue directory: {queue_dir}")
 
+        return queue_dir
+
+    def queue_task(self, parsed_issue: Dict, project_watcher: ProjectWatcher):
+        """Add task to processing queue with project context"""
+        queue_dir = self.queue_dir
+
         # Use project-id:issue-number for unique task file naming
         task_id = f"{parsed_issue['project_id']}-{parsed_issue['issue_id']}"
         task_file = queue_dir / f"task-{task_id}.json"
 
+        # Write under a name the queue readers don't match, then rename so a
+        # worker never picks up a half-written task
+        tmp_file = queue_dir / f".task-{task_id}.tmp"
+
         try:
-            task_file.write_text(json.dumps(parsed_issue, indent=2))
+            tmp_file.write_bytes(_dumps(parsed_issue))
+            tmp_file.replace(task_file)
             logger.info(f"[{project_watcher.project_id}] ✅ Queued task #{parsed_issue['issue_id']}: {parsed_issue['title']}")
         except Exception as e:
             logger.error(f"[{project_watcher.project_id}] Failed to queue task: {e}")
             raise
 
+    def process_issue(self, issue: Dict, project_watcher: ProjectWatcher) -> bool:
+        """Queue a single issue unless it was already processed
+
+        Returns:
+            True if the issue was queued by this call
+        """
+        issue_key = f"{project_watcher.project_id}:{issue['id']}"
+
+        # Hold the lock from the check until the issue is marked processed, so
+        # a webhook delivery and a poll can't queue the same issue twice
+        with self.lock:
+            if issue_key in self.processed_issues:
+                return False
+
+            logger.info(f"[{project_watcher.project_id}] Processing issue #{issue['id']}: {issue['title']}")
+
+            # Parse issue into task format (includes project context)
+            parsed = project_watcher.parse_issue(issue)
+
+            # Queue the task
+            self.queue_task(parsed, project_watcher)
+
+            # Mark as processed (project-id:issue-number)
+            self.processed_issues.add(issue_key)
+            self.save_processed_issues(issue_key)
+
+        # Update labels on the issue outside the lock: the API write may wait
+        # on the throttle, and other issues shouldn't queue behind it
+        project_watcher.update_issue_labels(issue)
+
+        logger.info(f"[{project_watcher.project_id}] ✅ Issue #{issue['id']} queued successfully")
+        return True
+
+    def fetch_all_issues(self) -> Dict[str, List[Dict]]:
+        """Fetch ready issues for every project concurrently
+
+        GitHub projects sharing a token go into one GraphQL query. Projects
+        alone on their token use the REST path, whose ETag polls are free when
+        nothing changed.
+
+        Returns:
+            Issues keyed by project_id
+        """
+        groups: Dict[str, List[ProjectWatcher]] = {}
+        single = []
+        for project_watcher in self.project_watchers:
+            if project_watcher.platform == 'github' and time.time() >= project_watcher.paused_until:
+                groups.setdefault(project_watcher.token, []).append(project_watcher)
+            else:
+                single.append(project_watcher)
+
+        batches = []
+        for watchers in groups.values():
+            if len(watchers) < 2:
+                single.extend(watchers)
+            else:
+                batches.append((watchers, self.fetch_pool.submit(self.query_github_issues, watchers)))
+
+        rest = {pw.project_id: self.fetch_pool.submit(pw.fetch_ready_issues) for pw in single}
+
+        results = {}
+        for watchers, future in batches:
+            try:
+                results.update(future.result())
+            except Exception as e:
+                # Retry these projects through the per-project REST fetch
+                logger.warning(f"GraphQL batch fetch failed, using REST: {e}")
+                for project_watcher in watchers:
+                    rest[project_watcher.project_id] = self.fetch_pool.submit(project_watcher.fetch_ready_issues)
+
+        # fetch_ready_issues logs its own errors and returns []
+        for project_id, future in rest.items():
+            results[project_id] = future.result()
+        return results
+
+    def query_github_issues(self, watchers: List[ProjectWatcher]) -> Dict[str, List[Dict]]:
+        """Run one aliased GraphQL query covering several repositories"""
+        aliases = []
+        for i, project_watcher in enumerate(watchers):
+            aliases.append(f'r{i}: repository(owner: {json.dumps(project_watcher.owner)}, '
+                           f'name: {json.dumps(project_watcher.repo)}) '
+                           f'{{ {GRAPHQL_ISSUES_FIELDS} }}')
+        query = '{ rateLimit { remaining resetAt } ' + ' '.join(aliases) + ' }'
+
+        response = watchers[0].github.request(watchers[0].session, 'POST', GITHUB_GRAPHQL_URL,
+                                              json={'query': query}, timeout=30)
+        response.raise_for_status()
+        data = response.json().get('data')
+        if not data:
+            raise ValueError(response.json().get('errors', 'empty response'))
+
+        rate_limit = data.get('rateLimit') or {}
+        if rate_limit.get('remaining', RATE_LIMIT_MIN_REMAINING) < RATE_LIMIT_MIN_REMAINING:
+            reset = datetime.fromisoformat(rate_limit['resetAt'].replace('Z', '+00:00')).timestamp()
+            logger.warning(f"GitHub GraphQL rate limit low ({rate_limit['remaining']} left)")
+            for project_watcher in watchers:
+                project_watcher.paused_until = reset
+
+        results = {}
+        for i, project_watcher in enumerate(watchers):
+            repository = data.get(f'r{i}')
+            if repository is None:
+                logger.error(f"[{project_watcher.project_id}] Repository not found via GraphQL")
+                results[project_watcher.project_id] = []
+                continue
+            results[project_watcher.project_id] = [{
+                'id': node['number'],
+                'title': node['title'],
+                'body': node['body'] or '',
+                'labels': [l['name'] for l in node['labels']['nodes']],
+                'url': node['url'],
+                'created_at': node['createdAt']
+            } for node in repository['issues']['nodes']]
+        return results
+
+    def find_project(self, platform: str, repo_path: str) -> Optional[ProjectWatcher]:
+        """Find the watcher for a repository ('owner/repo' path)"""
+        repo_path = repo_path.lower()
+        for project_watcher in self.project_watchers:
+            if project_watcher.platform == platform and project_watcher.repo_full.lower() == repo_path:
+                return project_watcher
+        return None
+
+    def start_webhook_server(self) -> bool:
+        """Start the webhook receiver in a background thread"""
+        try:
+            receiver = WebhookReceiver(self, self.webhook_config)
+            app = receiver.create_app()
+        except Exception as e:
+            logger.error(f"Webhook receiver not started: {e}")
+            return False
+
+        thread = threading.Thread(target=receiver.serve, args=(app,), name='webhook-server', daemon=True)
+        thread.start()
+        return True
+
     def run(self):
         """Main loop - poll all projects for issues and process them"""
         project_names = ', '.join([pw.project_name for pw in self.project_watchers])
+
+        if self.webhook_enabled and not self.start_webhook_server():
+            # Without webhooks the poll loop is the only source of issues again
+            self.poll_interval = self.config.get('poll_interval_seconds', 60)
+            logger.warning("Falling back to polling only")
+
         logger.info(f"🔍 Issue Watcher started (Phase 1.1 Multi-Project)")
         logger.info(f"   Projects: {project_names}")
         logger.info(f"   Polling every {self.poll_interval} seconds")
@@ -492,18 +850,19 @@ class IssueWatcher:
             try:
                 total_new_issues = 0
 
-                # Poll each project in sequence
+                # Fetch issues with 'ready' label for all projects at once
+                fetched = self.fetch_all_issues()
+
+                # Process each project in sequence
                 for project_watcher in self.project_watchers:
                     try:
-                        # Fetch issues with 'ready' label for this project
-                        issues = project_watcher.fetch_ready_issues()
+                        issues = fetched.get(project_watcher.project_id, [])
 
                         # Filter out already-processed issues (using project-id:issue-number format)
-                        new_issues = []
-                        for issue in issues:
-                            issue_key = f"{project_watcher.project_id}:{issue['id']}"
-                            if issue_key not in self.processed_issues:
-                                new_issues.append(issue)
+                        new_issues = [
+                            issue for issue in issues
+                            if f"{project_watcher.project_id}:{issue['id']}" not in self.processed_issues
+                        ]
 
                         if new_issues:
                             logger.info(f"[{project_watcher.project_id}] Found {len(new_issues)} new task(s)")
@@ -511,23 +870,7 @@ class IssueWatcher:
 
                         # Process each new issue
                         for issue in new_issues:
-                            logger.info(f"[{project_watcher.project_id}] Processing issue #{issue['id']}: {issue['title']}")
-
-                            # Parse issue into task format (includes project context)
-                            parsed = project_watcher.parse_issue(issue)
-
-                            # Queue the task
-                            self.queue_task(parsed, project_watcher)
-
-                            # Update labels on the issue
-                            project_watcher.update_issue_labels(issue)
-
-                            # Mark as processed (project-id:issue-number)
-                            issue_key = f"{project_watcher.project_id}:{issue['id']}"
-                            self.processed_issues.add(issue_key)
-                            self.save_processed_issues()
-
-                            logger.info(f"[{project_watcher.project_id}] ✅ Issue #{issue['id']} queued successfully")
+                            self.process_issue(issue, project_watcher)
 
                     except Exception as e:
                         logger.error(f"[{project_watcher.project_id}] Error processing project: {e}")
@@ -549,6 +892,167 @@ class IssueWatcher:
                 time.sleep(self.poll_interval)
 
 
+class WebhookReceiver:
+    """Receives GitHub/GitLab issue events and queues 'ready' issues immediately"""
+
+    def __init__(self, watcher: IssueWatcher, webhook_config: Dict):
+        """Initialize receiver with the watcher that owns queue state"""
+        self.watcher = watcher
+        self.host = webhook_config.get('host', DEFAULT_WEBHOOK_HOST)
+        self.port = webhook_config.get('port', DEFAULT_WEBHOOK_PORT)
+        self.secret = self.load_secret()
+
+    def load_secret(self) -> bytes:
+        """Load the shared webhook secret from the secrets directory"""
+        secret_file = SECRETS_DIR / 'webhook_secret'
+        if not secret_file.exists():
+            logger.error("Webhook secret not found")
+            logger.error(f"Create secret file: echo 'YOUR_SECRET' > ~/.config/lazy_birtd/secrets/webhook_secret")
+            raise FileNotFoundError("Webhook secret not found")
+
+        secret = secret_file.read_text().strip()
+        if not secret:
+            raise ValueError(f"Webhook secret file is empty: {secret_file}")
+        return secret.encode()
+
+    def verify_github(self, body: bytes, signature: Optional[str]) -> bool:
+        """Check the X-Hub-Signature-256 HMAC of a GitHub delivery"""
+        if not signature:
+            return False
+        expected = 'sha256=' + hmac.new(self.secret, body, hashlib.sha256).hexdigest()
+        return hmac.compare_digest(expected, signature)
+
+    def verify_gitlab(self, token: Optional[str]) -> bool:
+        """Check the X-Gitlab-Token of a GitLab delivery"""
+        return bool(token) and hmac.compare_digest(self.secret, token.encode())
+
+    def handle_github(self, event: str, payload: Dict) -> str:
+        """Queue the issue from a GitHub 'issues' event if it is ready"""
+        if event == 'ping':
+            return 'pong'
+        if event != 'issues':
+            return 'ignored'
+
+        action = payload.get('action')
+        issue = payload.get('issue') or {}
+        labels = [l['name'] for l in issue.get('labels', [])]
+
+        if action == 'labeled':
+            ready = (payload.get('label') or {}).get('name') == 'ready'
+        else:
+            ready = action in ('opened', 'reopened') and 'ready' in labels
+        if not ready or issue.get('state') != 'open' or 'pull_request' in issue:
+            return 'ignored'
+
+        repo_path = (payload.get('repository') or {}).get('full_name', '')
+        project_watcher = self.watcher.find_project('github', repo_path)
+        if not project_watcher:
+            logger.warning(f"Webhook for unconfigured repository: {repo_path}")
+            return 'ignored'
+
+        queued = self.watcher.process_issue(ProjectWatcher.github_issue(issue), project_watcher)
+        return 'queued' if queued else 'duplicate'
+
+    def handle_gitlab(self, event: str, payload: Dict) -> str:
+        """Queue the issue from a GitLab 'Issue Hook' event if it is ready"""
+        if event != 'Issue Hook':
+            return 'ignored'
+
+        attrs = payload.get('object_attributes') or {}
+        labels = [l['title'] for l in payload.get('labels', [])]
+        if attrs.get('state') != 'opened' or 'ready' not in labels:
+            return 'ignored'
+
+        repo_path = (payload.get('project') or {}).get('path_with_namespace', '')
+        project_watcher = self.watcher.find_project('gitlab', repo_path)
+        if not project_watcher:
+            logger.warning(f"Webhook for unconfigured repository: {repo_path}")
+            return 'ignored'
+
+        issue = {
+            'id': attrs['iid'],
+            'title': attrs['title'],
+            'body': attrs.get('description') or '',
+            'labels': labels,
+            'url': attrs.get('url'),
+            'created_at': attrs.get('created_at')
+        }
+        queued = self.watcher.process_issue(issue, project_watcher)
+        return 'queued' if queued else 'duplicate'
+
+    def create_app(self):
+        """Create the Flask app serving the webhook endpoints"""
+        try:
+            from flask import Flask, request, jsonify
+        except ImportError:
+            raise ImportError("Flask not installed. Install with: pip3 install flask")
+
+        app = Flask('issue-watcher')
+
+        @app.route('/webhooks/github', methods=['POST'])
+        def github_webhook():
+            body = request.get_data()
+            if not self.verify_github(body, request.headers.get('X-Hub-Signature-256')):
+                return jsonify({'error': 'Invalid signature'}), 401
+
+            # GitHub delivers either raw JSON or a form with a 'payload' field
+            if request.mimetype == 'application/json':
+                raw = body
+            elif request.mimetype == 'application/x-www-form-urlencoded':
+                raw = request.form.get('payload')
+            else:
+                return jsonify({'error': 'Unsupported content type'}), 415
+            try:
+                payload = json.loads(raw) if raw else None
+            except ValueError:
+                payload = None
+            if not isinstance(payload, dict):
+                return jsonify({'error': 'Invalid payload'}), 400
+
+            try:
+                result = self.handle_github(request.headers.get('X-GitHub-Event', ''), payload)
+                return jsonify({'result': result})
+            except Exception as e:
+                logger.error(f"GitHub webhook error: {e}")
+                return jsonify({'error': 'Webhook processing failed'}), 500
+
+        @app.route('/webhooks/gitlab', methods=['POST'])
+        def gitlab_webhook():
+            if not self.verify_gitlab(request.headers.get('X-Gitlab-Token')):
+                return jsonify({'error': 'Invalid token'}), 401
+
+            payload = request.get_json(force=True, silent=True)
+            if not isinstance(payload, dict):
+                return jsonify({'error': 'Invalid payload'}), 400
+
+            try:
+                result = self.handle_gitlab(request.headers.get('X-Gitlab-Event', ''), payload)
+                return jsonify({'result': result})
+            except Exception as e:
+                logger.error(f"GitLab webhook error: {e}")
+                return jsonify({'error': 'Webhook processing failed'}), 500
+
+        return app
+
+    def serve(self, app):
+        """Run the webhook HTTP server (blocks)
+
+        Uses waitress when installed; the Flask development server is only a
+        fallback and shouldn't face the internet directly.
+        """
+        logger.info(f"🪝 Webhook receiver listening on {self.host}:{self.port}")
+        try:
+            from waitress import serve
+        except ImportError:
+            logger.warning("waitress not installed, falling back to Flask development server "
+                           "(install with: pip3 install waitress)")
+            app.run(host=self.host, port=self.port, threaded=True, use_reloader=False)
+            return
+
+        serve(app, host=self.host, port=self.port, threads=WEBHOOK_THREADS,
+              clear_untrusted_proxy_headers=True, ident='lazy-bird-webhooks')
+
+
 def main():
     """Entry point"""
     # Look for config file
@@ -23,7 +23,11 @@ def list_projects():
     """
     try:
         projects = config_service.get_projects()
-        return jsonify(projects), 200
+
+        # Unchanged lists get a 304 so UI polling skips the body
+        response = jsonify(projects)
+        response.add_etag()
+        return response.make_conditional(request)
     except Exception as e:
         logger.error(f"Error listing projects: {e}")
         return jsonify({'error': str(e)}), 500
@@ -167,49 +171,26 @@ def delete_project(project_id):
         return jsonify({'error': str(e)}), 500
 
 
-@projects_bp.route('/<project_id>/enable', methods=['POST'])
-def enable_project(project_id):
-    """
-    Enable a project
-
-    Args:
-        project_id: Project ID to enable
-
-    Returns:
-        200: Project enabled
-        404: Project not found
-        500: Server error
-    """
-    try:
-        project = config_service.update_project(project_id, {'enabled': True})
-        return jsonify(project), 200
-
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 404
-    except Exception as e:
-        logger.error(f"Error enabling project {project_id}: {e}")
-        return jsonify({'error': str(e)}), 500
-
-
-@projects_bp.route('/<project_id>/disable', methods=['POST'])
-def disable_project(project_id):
+@projects_bp.route('/<project_id>/<any(enable, disable):action>', methods=['POST'])
+def set_project_enabled(project_id, action):
     """
-    Disable a project
+    Enable or disable a project
 
     Args:
-        project_id: Project ID to disable
+        project_id: Project ID to enable/disable
+        action: 'enable' or 'disable'
 
     Returns:
-        200: Project disabled
+        200: Project enabled/disabled
         404: Project not found
         500: Server error
     """
     try:
-        project = config_service.update_project(project_id, {'enabled': False})
+        project = config_service.update_project(project_id, {'enabled': action == 'enable'})
         return jsonify(project), 200
 
     except ValueError as e:
         return jsonify({'error': str(e)}), 404
     except Exception as e:
-        logger.error(f"Error disabling project {project_id}: {e}")
+        logger.error(f"Error {action[:-1]}ing project {project_id}: {e}")
         return jsonify({'error': str(e)}), 500
@@ -30,20 +30,17 @@ def list_tasks():
         # Check if we should include completed tasks
         include_completed = request.args.get('include_completed', 'false').lower() == 'true'
 
-        # Get all tasks with status
-        tasks = queue_service.get_all_tasks_with_status(include_completed=include_completed)
-
-        # Filter by project if specified
-        project_id = request.args.get('project_id')
-        if project_id:
-            tasks = [t for t in tasks if t.get('project_id') == project_id]
-
-        # Filter by status if specified
-        status = request.args.get('status')
-        if status:
-            tasks = [t for t in tasks if t.get('status') == status]
-
-        return jsonify(tasks), 200
+        # Get tasks with status, filtered by project/status in the service
+        tasks = queue_service.get_all_tasks_with_status(
+            include_completed=include_completed,
+            project_id=request.args.get('project_id'),
+            status=request.args.get('status')
+        )
+
+        # Unchanged lists get a 304 so UI polling skips the body
+        response = jsonify(tasks)
+        response.add_etag()
+        return response.make_conditional(request)
 
     except Exception as e:
         logger.error(f"Error listing tasks: {e}")
@@ -113,7 +110,10 @@ def get_queue_stats():
     """
     try:
         stats = queue_service.get_queue_stats()
-        return jsonify(stats), 200
+
+        response = jsonify(stats)
+        response.add_etag()
+        return response.make_conditional(request)
 
     except Exception as e:
         logger.error(f"Error getting queue stats: {e}")
@@ -3,14 +3,36 @@ Settings API endpoints
 Manage GitHub token and other configuration
 """
 import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 from pathlib import Path
 from flask import Blueprint, request, jsonify
 import logging
+import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger('lazy-bird-api')
 
 settings_bp = Blueprint('settings', __name__, url_prefix='/api/settings')
 
+GITHUB_API_TIMEOUT = 5  # Seconds to wait for api.github.com when testing a token
+TOKEN_PREFIXES = ('ghp_', 'gho_', 'github_pat_')  # Accepted GitHub token formats
+TOKEN_READ_LIMIT = 4096  # Bytes read from the token file (tokens are under 100)
+
+# Shared session so repeated token tests reuse the keep-alive TLS connection
+_gh_session = requests.Session()
+_gh_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_gh_session.headers.update({'Accept': 'application/vnd.github+json'})
+
+# Token checks run here; concurrent tests of the same token share one request
+_gh_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='github-token')
+_gh_inflight = {}
+_gh_inflight_lock = threading.Lock()
+
+# (file key, token) - replaced as one tuple so readers never see a mixed pair
+_token_cache = (None, None)
+
 
 def get_secrets_dir():
     """Get the secrets directory path"""
@@ -22,6 +44,117 @@ def get_token_path():
     return get_secrets_dir() / 'api_token'
 
 
+def _ensure_mode(path, mode):
+    """Set permission bits on path only if they differ (skips the chmod syscall)"""
+    if path.stat().st_mode & 0o777 != mode:
+        os.chmod(path, mode)
+
+
+def _write_token_file(path, token):
+    """
+    Atomically replace the token file so readers see the old or new token, never a partial one
+
+    Args:
+        path: Path to the token file
+        token: Token to store
+    """
+    # mkstemp creates the file 0600, so the token is never readable by others
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        try:
+            os.write(fd, token.encode('utf-8'))
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _read_token_file(path):
+    """
+    Read the token file with a single unbuffered read
+
+    Args:
+        path: Path to the token file
+
+    Returns:
+        Token string with surrounding whitespace removed
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, TOKEN_READ_LIMIT).decode('utf-8').strip()
+    finally:
+        os.close(fd)
+
+
+def _load_token():
+    """
+    Get the saved GitHub token, re-reading the file only when it changed
+
+    Returns:
+        Token string, or None if no token file exists
+    """
+    global _token_cache
+    try:
+        stat = get_token_path().stat()
+    except FileNotFoundError:
+        return None
+
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached_key, token = _token_cache
+    if key != cached_key:
+        token = _read_token_file(get_token_path())
+        _token_cache = (key, token)
+
+    return token
+
+
+def _fetch_github_user(token):
+    """
+    Request the authenticated user's profile from the GitHub API
+
+    Args:
+        token: GitHub token to authenticate with
+
+    Returns:
+        requests Response for GET /user
+    """
+    headers = {'Authorization': f'token {token}'}
+    return _gh_session.get('https://api.github.com/user', headers=headers,
+                           timeout=GITHUB_API_TIMEOUT)
+
+
+def _check_token(token):
+    """
+    Validate a token on the worker pool, joining an identical in-flight check
+
+    Args:
+        token: GitHub token to validate
+
+    Returns:
+        requests Response for GET /user
+
+    Raises:
+        concurrent.futures.TimeoutError: GitHub took longer than GITHUB_API_TIMEOUT
+    """
+    with _gh_inflight_lock:
+        future = _gh_inflight.get(token)
+        if future is None:
+            future = _gh_pool.submit(_fetch_github_user, token)
+            _gh_inflight[token] = future
+            future.add_done_callback(lambda f: _forget_check(token, f))
+
+    return future.result(timeout=GITHUB_API_TIMEOUT)
+
+
+def _forget_check(token, future):
+    """Drop a finished check so the next test hits GitHub again"""
+    with _gh_inflight_lock:
+        if _gh_inflight.get(token) is future:
+            del _gh_inflight[token]
+
+
 @settings_bp.route('/token', methods=['GET'])
 def get_token_status():
     """
@@ -29,18 +162,15 @@ def get_token_status():
     Returns whether a token exists and its first/last few characters
     """
     try:
-        token_path = get_token_path()
+        token = _load_token()
 
-        if not token_path.exists():
+        if token is None:
             return jsonify({
                 'exists': False,
                 'masked_token': None,
                 'length': 0
             }), 200
 
-        with open(token_path, 'r') as f:
-            token = f.read().strip()
-
         # Mask token (show first 4 and last 4 chars)
         if len(token) > 8:
             masked = f"{token[:4]}...{token[-4:]}"
@@ -68,6 +198,7 @@ def update_token():
         "token": "ghp_xxxxxxxxxxxx"
     }
     """
+    global _token_cache
     try:
         data = request.get_json()
 
@@ -80,7 +211,7 @@ def update_token():
             return jsonify({'error': 'Token cannot be empty'}), 400
 
         # Validate token format (GitHub tokens start with ghp_, gho_, etc.)
-        if not any(token.startswith(prefix) for prefix in ['ghp_', 'gho_', 'github_pat_']):
+        if not token.startswith(TOKEN_PREFIXES):
             return jsonify({
                 'error': 'Invalid token format. GitHub tokens should start with ghp_, gho_, or github_pat_'
             }), 400
@@ -88,15 +219,13 @@ def update_token():
         # Create secrets directory if it doesn't exist
         secrets_dir = get_secrets_dir()
         secrets_dir.mkdir(parents=True, exist_ok=True)
-        os.chmod(secrets_dir, 0o700)
+        _ensure_mode(secrets_dir, 0o700)
 
-        # Write token to file
-        token_path = get_token_path()
-        with open(token_path, 'w') as f:
-            f.write(token)
+        # Write token to file (created with 0600 permissions)
+        _write_token_file(get_token_path(), token)
 
-        # Set secure permissions
-        os.chmod(token_path, 0o600)
+        # Same-size rewrites within the mtime granularity would look unchanged
+        _token_cache = (None, None)
 
         logger.info(f"GitHub token updated successfully")
 
@@ -124,22 +253,22 @@ def test_token():
     Test if the current GitHub token is valid
     """
     try:
-        import requests
-
-        token_path = get_token_path()
+        token = _load_token()
 
-        if not token_path.exists():
+        if token is None:
             return jsonify({
                 'valid': False,
                 'error': 'No token found'
             }), 200
 
-        with open(token_path, 'r') as f:
-            token = f.read().strip()
-
         # Test token by making a request to GitHub API
-        headers = {'Authorization': f'token {token}'}
-        response = requests.get('https://api.github.com/user', headers=headers)
+        try:
+            response = _check_token(token)
+        except FutureTimeout:
+            return jsonify({
+                'valid': False,
+                'error': 'GitHub API did not respond in time'
+            }), 504
 
         if response.status_code == 200:
             user_data = response.json()
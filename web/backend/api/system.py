@@ -6,6 +6,8 @@ from flask import Blueprint, request, jsonify
 import logging
 import psutil
 import os
+import time
+import threading
 from services.systemd_service import SystemdService
 from services.config_service import ConfigService
 
@@ -15,6 +17,88 @@ system_bp = Blueprint('system', __name__, url_prefix='/api/system')
 systemd_service = SystemdService(user_mode=True)
 config_service = ConfigService()
 
+RESOURCE_SAMPLE_INTERVAL = 2  # Seconds between background CPU/memory samples
+DISK_SAMPLE_INTERVAL = 10  # Disk usage barely moves, so statvfs it less often
+
+_resources = None  # Latest sample, replaced whole so readers never need the lock
+_sampler_lock = threading.Lock()
+_sampler_thread = None
+_sampler_pid = None
+
+
+def sample_resources(interval=None, disk=None):
+    """
+    Take one CPU, memory and disk usage sample
+
+    Args:
+        interval: Seconds to measure CPU over (None = since the previous call)
+        disk: Recent psutil.disk_usage('/') result to reuse (None = query now)
+
+    Returns:
+        Dictionary of resource usage figures
+    """
+    cpu_percent = psutil.cpu_percent(interval=interval)
+    memory = psutil.virtual_memory()
+    if disk is None:
+        disk = psutil.disk_usage('/')
+
+    return {
+        'cpu_percent': cpu_percent,
+        'memory_percent': memory.percent,
+        'memory_used_gb': round(memory.used / (1024**3), 2),
+        'memory_total_gb': round(memory.total / (1024**3), 2),
+        'disk_percent': disk.percent,
+        'disk_free_gb': round(disk.free / (1024**3), 2),
+        'disk_total_gb': round(disk.total / (1024**3), 2)
+    }
+
+
+def _sample_loop():
+    """Refresh the shared resource sample until the process exits"""
+    global _resources
+    disk = None
+    disk_sampled_at = 0.0
+    while True:
+        try:
+            if disk is None or time.monotonic() - disk_sampled_at >= DISK_SAMPLE_INTERVAL:
+                disk = psutil.disk_usage('/')
+                disk_sampled_at = time.monotonic()
+
+            # cpu_percent blocks for the interval, which also paces the loop
+            _resources = sample_resources(interval=RESOURCE_SAMPLE_INTERVAL, disk=disk)
+        except Exception as e:
+            logger.error(f"Error sampling system resources: {e}")
+            time.sleep(RESOURCE_SAMPLE_INTERVAL)
+
+
+def start_resource_sampler():
+    """Start the background resource sampler (once per process)"""
+    global _sampler_thread, _sampler_pid
+    with _sampler_lock:
+        # Threads don't survive fork, so preloaded gunicorn workers start their own
+        if _sampler_pid != os.getpid():
+            _sampler_thread = threading.Thread(target=_sample_loop, name='resource-sampler',
+                                               daemon=True)
+            _sampler_thread.start()
+            _sampler_pid = os.getpid()
+
+
+def get_resources():
+    """
+    Get the latest resource sample without blocking on psutil
+
+    Returns:
+        Dictionary of resource usage figures
+    """
+    if _sampler_pid != os.getpid():
+        start_resource_sampler()
+
+    resources = _resources
+    if resources is None:
+        # Sampler hasn't finished its first interval yet
+        resources = sample_resources()
+    return resources
+
 
 @system_bp.route('/status', methods=['GET'])
 def get_system_status():
@@ -28,15 +112,10 @@ def get_system_status():
         # Get service statuses
         services = systemd_service.get_all_services_status()
 
-        # Get system resources
-        cpu_percent = psutil.cpu_percent(interval=1)
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
-
         # Get configuration info
         try:
-            config = config_service.load_config()
-            phase = config.get('phase', 1)
+            # Both accessors share ConfigService's parsed-config cache
+            phase = config_service.get_system_config()['phase']
             projects_count = len(config_service.get_projects())
         except:
             phase = 'unknown'
@@ -44,15 +123,7 @@ def get_system_status():
 
         return jsonify({
             'services': services,
-            'resources': {
-                'cpu_percent': cpu_percent,
-                'memory_percent': memory.percent,
-                'memory_used_gb': round(memory.used / (1024**3), 2),
-                'memory_total_gb': round(memory.total / (1024**3), 2),
-                'disk_percent': disk.percent,
-                'disk_free_gb': round(disk.free / (1024**3), 2),
-                'disk_total_gb': round(disk.total / (1024**3), 2)
-            },
+            'resources': get_resources(),
             'config': {
                 'phase': phase,
                 'projects_count': projects_count
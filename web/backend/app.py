@@ -13,7 +13,12 @@ Features:
 - Test coordination (from godot-server)
 
 Usage:
-    python3 app.py [--port 5001] [--host 127.0.0.1]
+    python3 app.py [--port 5001] [--host 127.0.0.1] [--threads 8]
+
+Served by waitress when installed (pip3 install waitress), otherwise by the
+Flask development server. For several processes, use gunicorn with the wsgi
+module (status caches are per process, see run_http_server):
+    gunicorn -k gthread -w 4 --threads 8 --keep-alive 30 --preload --chdir web/backend wsgi:app
 """
 
 import os
@@ -21,8 +26,19 @@ import sys
 import logging
 import argparse
 from flask import Flask, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 
+try:
+    import orjson
+except ImportError:  # Optional - falls back to Flask's stdlib json provider
+    orjson = None
+
+try:
+    from flask_compress import Compress
+except ImportError:  # Optional - responses are sent uncompressed
+    Compress = None
+
 # Logging setup
 logging.basicConfig(
     level=logging.INFO,
@@ -30,8 +46,47 @@ logging.basicConfig(
 )
 logger = logging.getLogger('lazy-bird-api')
 
+KEEP_ALIVE_SECONDS = 30  # UI polling reuses its connection between refreshes
+DEFAULT_THREADS = 8  # Request threads per process (waitress)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson (used by jsonify and request.get_json)"""
+
+    def _option(self, indent: bool = False) -> int:
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self._option()).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Build the jsonify() response straight from orjson's bytes (no str round trip)"""
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = orjson.dumps(obj, default=self.default,
+                            option=self._option(indent) | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
 # Create Flask app
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
+# Gzip JSON responses; task lists repeat the same keys and shrink ~10x
+if Compress is not None:
+    app.config['COMPRESS_MIMETYPES'] = ['application/json']
+    app.config['COMPRESS_LEVEL'] = 4
+    app.config['COMPRESS_MIN_SIZE'] = 1024
+    Compress(app)
 
 # Enable CORS for frontend development
 # In production, restrict to specific origins
@@ -47,7 +102,7 @@ CORS(app, resources={
 # Import and register blueprints
 try:
     from api.projects import projects_bp
-    from api.system import system_bp
+    from api.system import system_bp, start_resource_sampler
     from api.queue import queue_bp
     from api.settings import settings_bp
 
@@ -56,6 +111,9 @@ try:
     app.register_blueprint(queue_bp)
     app.register_blueprint(settings_bp)
 
+    # CPU/memory/disk are sampled off the request path for /api/system/status
+    start_resource_sampler()
+
     logger.info("API blueprints registered successfully")
 
 except ImportError as e:
@@ -64,28 +122,35 @@ except ImportError as e:
     sys.exit(1)
 
 
+# Invariant payloads, serialized once; each request still gets its own
+# Response object because CORS and compression modify it in place
+_INDEX_BODY = app.json.dumps({
+    'name': 'Lazy_Bird API',
+    'version': '1.0.0',
+    'phase': '1.1',
+    'endpoints': {
+        'projects': '/api/projects',
+        'system': '/api/system',
+        'queue': '/api/queue'
+    }
+}).encode() + b'\n'
+
+_HEALTH_BODY = app.json.dumps({
+    'status': 'healthy',
+    'service': 'lazy-bird-api'
+}).encode() + b'\n'
+
+
 @app.route('/')
 def index():
     """Root endpoint"""
-    return jsonify({
-        'name': 'Lazy_Bird API',
-        'version': '1.0.0',
-        'phase': '1.1',
-        'endpoints': {
-            'projects': '/api/projects',
-            'system': '/api/system',
-            'queue': '/api/queue'
-        }
-    })
+    return app.response_class(_INDEX_BODY, mimetype='application/json')
 
 
 @app.route('/health')
 def health():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'service': 'lazy-bird-api'
-    }), 200
+    return app.response_class(_HEALTH_BODY, mimetype='application/json'), 200
 
 
 @app.errorhandler(404)
@@ -108,11 +173,49 @@ def parse_args():
                         help='Host to bind to (default: 127.0.0.1)')
     parser.add_argument('--port', type=int, default=5000,
                         help='Port to bind to (default: 5000)')
+    parser.add_argument('--threads', type=int, default=DEFAULT_THREADS,
+                        help=f'Request threads for waitress (default: {DEFAULT_THREADS})')
+    parser.add_argument('--server', choices=['auto', 'waitress', 'flask'],
+                        default='auto',
+                        help='HTTP server to use (default: auto - waitress if installed)')
     parser.add_argument('--debug', action='store_true',
                         help='Enable debug mode')
     return parser.parse_args()
 
 
+def run_http_server(host: str, port: int, server: str = 'auto', debug: bool = False,
+                    threads: int = DEFAULT_THREADS):
+    """
+    Serve the API over HTTP
+
+    waitress serves a single process with a pool of request threads. Config,
+    queue and logs are on disk, but the service status caches, the D-Bus
+    connection and the metrics sampler are per process, so one process keeps
+    a start/stop visible to every request. Falls back to Flask's threaded
+    development server when waitress isn't installed or in debug mode.
+    """
+    if debug:
+        server = 'flask'
+
+    if server in ('auto', 'waitress'):
+        try:
+            from waitress import serve
+        except ImportError:
+            if server == 'waitress':
+                logger.error("waitress not installed. Install with: pip3 install waitress")
+                sys.exit(1)
+        else:
+            logger.info(f"Serving with waitress ({threads} thread(s))")
+            serve(app, host=host, port=port, threads=threads,
+                  channel_timeout=KEEP_ALIVE_SECONDS, clear_untrusted_proxy_headers=True,
+                  ident='lazy-bird-api')
+            return
+
+    if server == 'auto':
+        logger.warning("waitress not installed, falling back to Flask development server")
+    app.run(host=host, port=port, debug=debug, threaded=True)
+
+
 def main():
     """Main entry point"""
     args = parse_args()
@@ -123,11 +226,8 @@ def main():
     logger.info(f"Debug: {args.debug}")
 
     try:
-        app.run(
-            host=args.host,
-            port=args.port,
-            debug=args.debug
-        )
+        run_http_server(args.host, args.port, server=args.server, debug=args.debug,
+                        threads=max(1, args.threads))
     except KeyboardInterrupt:
         logger.info("Shutting down gracefully...")
     except Exception as e:
@@ -3,10 +3,36 @@ Configuration Service
 Handles reading and writing config.yml for Lazy_Bird
 """
 import os
+import copy
+import json
+import logging
+import tempfile
+import time
 import yaml
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+try:
+    # libyaml bindings (bundled with most PyYAML wheels) parse/emit several times faster
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml - pure-Python fallback
+    from yaml import SafeLoader, SafeDumper
+
+logger = logging.getLogger(__name__)
+
+# File mtimes this recent may still change within the same tick
+RACY_MTIME_NS = 1_000_000_000
+
+# Non-project settings exposed by get_system_config, with their defaults
+SYSTEM_CONFIG_DEFAULTS = {
+    'poll_interval_seconds': 60,
+    'phase': 1,
+    'max_concurrent_agents': 1,
+    'memory_limit_gb': 8,
+    'retry': {},
+    'notifications': {}
+}
+
 
 class ConfigService:
     """Service for managing Lazy_Bird configuration"""
@@ -23,10 +49,24 @@ class ConfigService:
         else:
             self.config_path = Path.home() / '.config' / 'lazy_birtd' / 'config.yml'
 
+        # JSON copy of the parsed YAML so a fresh process can skip YAML parsing
+        self.sidecar_path = self.config_path.with_name(self.config_path.name + '.json')
+
+        # Parsed config cache, keyed on the file's (mtime, size)
+        self._cache_key = None
+        self._cache: Dict[str, Any] = {}
+        self._projects: List[Dict[str, Any]] = []
+        self._projects_by_id: Dict[str, Dict[str, Any]] = {}
+        self._project_positions: Dict[str, int] = {}
+        self._system_config: Dict[str, Any] = {}
+
     def load_config(self) -> Dict[str, Any]:
         """
         Load configuration from YAML file
 
+        Served from the parsed-config cache while the file is unchanged; the
+        returned dict is a private copy that callers may modify.
+
         Returns:
             Configuration dictionary
 
@@ -34,11 +74,17 @@ class ConfigService:
             FileNotFoundError: If config file doesn't exist
             yaml.YAMLError: If YAML is invalid
         """
-        if not self.config_path.exists():
-            raise FileNotFoundError(f"Config file not found: {self.config_path}")
+        return copy.deepcopy(self._cached_config())
 
+    def _read_config(self) -> Dict[str, Any]:
+        """
+        Read and parse the YAML file, bypassing the cache
+
+        Returns:
+            Configuration dictionary
+        """
         with open(self.config_path, 'r') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=SafeLoader)
 
         return config if config else {}
 
@@ -52,27 +98,178 @@ class ConfigService:
         # Create directory if it doesn't exist
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(self.config_path, 'w') as f:
-            yaml.safe_dump(config, f, default_flow_style=False, sort_keys=False)
+        # The new file is re-read (and its sidecar written) by the first load
+        # after its mtime stops being racy; nothing is cached from here
+        self._cache_key = None
+        self._write_atomic(config)
 
-    def get_projects(self) -> List[Dict[str, Any]]:
+    def _write_atomic(self, config: Dict[str, Any]) -> None:
         """
-        Get list of all projects from config
+        Write config.yml via a temp file and rename, so readers and crashes
+        never see a half-written file
+
+        No fsync: a power loss may lose the latest save (the previous file
+        survives intact), which is acceptable for a UI-edited config and keeps
+        saves from stalling behind other disk writers.
+
+        Args:
+            config: Configuration dictionary to save
+        """
+        # Replace the real file, not a symlink pointing at it
+        target = self.config_path.resolve()
+        try:
+            mode = target.stat().st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+
+        fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.",
+                                        suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                yaml.dump(config, f, Dumper=SafeDumper, default_flow_style=False,
+                          sort_keys=False)
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, target)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _cached_config(self) -> Dict[str, Any]:
+        """
+        Get the parsed config, re-reading the file only when it changed
+
+        The returned dict is shared between calls and must not be mutated;
+        writers use load_config() for a private copy.
 
         Returns:
-            List of project dictionaries
+            Configuration dictionary
         """
-        config = self.load_config()
+        try:
+            stat = self.config_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {self.config_path}")
+
+        key = self._stable_key(stat)
+        if key is None or key != self._cache_key:
+            config = self._read_sidecar(key) if key is not None else None
+            if config is None:
+                config = self._read_config()
+                if key is not None:
+                    self._write_sidecar(config, key)
+            self._set_cache(config, key)
+
+        return self._cache
+
+    @staticmethod
+    def _stable_key(stat: os.stat_result) -> Optional[tuple]:
+        """
+        Cache key for config.yml, if its mtime can be trusted
+
+        A same-size edit in the same timestamp tick as the last read wouldn't
+        change (mtime, size), so a just-modified file isn't cached yet.
+
+        Args:
+            stat: os.stat() of config.yml
+
+        Returns:
+            (mtime_ns, size), or None if the file changed too recently
+        """
+        if time.time_ns() - stat.st_mtime_ns <= RACY_MTIME_NS:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _read_sidecar(self, key) -> Optional[Dict[str, Any]]:
+        """
+        Load the JSON sidecar if it was generated from the current YAML file
+
+        Args:
+            key: (mtime_ns, size) of config.yml right now
+
+        Returns:
+            Configuration dictionary, or None if the sidecar is missing or stale
+        """
+        try:
+            with open(self.sidecar_path, 'r') as f:
+                sidecar = json.load(f)
+        except (OSError, ValueError):
+            return None
 
+        if not isinstance(sidecar, dict) or sidecar.get('source') != list(key):
+            return None
+        return sidecar.get('config')
+
+    def _write_sidecar(self, config: Dict[str, Any], key) -> None:
+        """
+        Write the JSON sidecar for the YAML file identified by key
+
+        Skipped when the config doesn't survive a JSON round trip unchanged
+        (e.g. YAML dates or non-string keys), so the sidecar is never lossy.
+
+        Args:
+            config: Parsed configuration
+            key: (mtime_ns, size) of the YAML file it came from
+        """
+        try:
+            data = json.dumps({'source': list(key), 'config': config})
+            if json.loads(data)['config'] != config:
+                return
+
+            # Same permissions as config.yml: the sidecar is a full copy of it
+            mode = self.config_path.stat().st_mode & 0o777
+            fd, tmp_path = tempfile.mkstemp(dir=self.sidecar_path.parent,
+                                            prefix=f".{self.sidecar_path.name}.", suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    f.write(data)
+                os.chmod(tmp_path, mode)
+                os.replace(tmp_path, self.sidecar_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Not writing config sidecar {self.sidecar_path}: {e}")
+
+    def _set_cache(self, config: Dict[str, Any], key) -> None:
+        """
+        Store a parsed config, its project indexes and its system settings
+
+        Args:
+            config: Parsed configuration (owned by the cache from now on)
+            key: (mtime_ns, size) of the file it was read from or written to
+                (None if it may still change unnoticed)
+        """
         # Phase 1.1: Multi-project support
         if 'projects' in config and isinstance(config['projects'], list):
-            return config['projects']
-
+            projects = config['projects']
         # Legacy single-project support
-        if 'project' in config:
-            return [config['project']]
+        elif 'project' in config:
+            projects = [config['project']]
+        else:
+            projects = []
+
+        self._cache = config
+        self._projects = projects
+        self._projects_by_id = {p.get('id'): p for p in reversed(projects)}
+        # Index into config['projects'] (first entry wins, like a forward scan)
+        self._project_positions = {
+            p.get('id'): i for i, p in reversed(list(enumerate(config.get('projects') or [])))
+        } if projects is config.get('projects') else {}
+        # Defaults are copied so the shared {} values never end up in a cached config
+        self._system_config = {
+            field: config[field] if field in config else copy.copy(default)
+            for field, default in SYSTEM_CONFIG_DEFAULTS.items()
+        }
+        self._cache_key = key
 
-        return []
+    def get_projects(self) -> List[Dict[str, Any]]:
+        """
+        Get list of all projects from config
+
+        Returns:
+            List of project dictionaries
+        """
+        self._cached_config()
+        return self._projects
 
     def get_project(self, project_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -84,10 +281,29 @@ class ConfigService:
         Returns:
             Project dictionary or None if not found
         """
-        projects = self.get_projects()
-        for project in projects:
+        self._cached_config()
+        return self._projects_by_id.get(project_id)
+
+    def _project_position(self, config: Dict[str, Any], project_id: str) -> Optional[int]:
+        """
+        Find a project's index in config['projects'] of a load_config() copy
+
+        Args:
+            config: Dictionary returned by load_config()
+            project_id: Project ID to find
+
+        Returns:
+            List index, or None if the project isn't in config['projects']
+        """
+        projects = config.get('projects') or []
+        i = self._project_positions.get(project_id)
+        if i is not None and i < len(projects) and projects[i].get('id') == project_id:
+            return i
+
+        # Cache was refreshed by another thread between load and lookup
+        for i, project in enumerate(projects):
             if project.get('id') == project_id:
-                return project
+                return i
         return None
 
     def add_project(self, project: Dict[str, Any]) -> Dict[str, Any]:
@@ -151,23 +367,22 @@ class ConfigService:
             ValueError: If project not found
         """
         config = self.load_config()
-        projects = config.get('projects', [])
 
         # Find and update project
-        for i, project in enumerate(projects):
-            if project.get('id') == project_id:
-                # Update fields
-                projects[i].update(updates)
-                # Don't allow ID changes
-                projects[i]['id'] = project_id
+        i = self._project_position(config, project_id)
+        if i is None:
+            raise ValueError(f"Project '{project_id}' not found")
 
-                # Save config
-                config['projects'] = projects
-                self.save_config(config)
+        project = config['projects'][i]
+        # Update fields
+        project.update(updates)
+        # Don't allow ID changes
+        project['id'] = project_id
 
-                return projects[i]
+        # Save config
+        self.save_config(config)
 
-        raise ValueError(f"Project '{project_id}' not found")
+        return project
 
     def delete_project(self, project_id: str) -> None:
         """
@@ -180,15 +395,13 @@ class ConfigService:
             ValueError: If project not found
         """
         config = self.load_config()
-        projects = config.get('projects', [])
 
-        # Find and remove project
-        initial_count = len(projects)
-        projects = [p for p in projects if p.get('id') != project_id]
-
-        if len(projects) == initial_count:
+        if self._project_position(config, project_id) is None:
             raise ValueError(f"Project '{project_id}' not found")
 
+        # Remove every entry with this ID (duplicates included)
+        projects = [p for p in config['projects'] if p.get('id') != project_id]
+
         config['projects'] = projects
         self.save_config(config)
 
@@ -199,19 +412,8 @@ class ConfigService:
         Returns:
             System configuration dictionary
         """
-        config = self.load_config()
-
-        # Extract non-project settings
-        system_config = {
-            'poll_interval_seconds': config.get('poll_interval_seconds', 60),
-            'phase': config.get('phase', 1),
-            'max_concurrent_agents': config.get('max_concurrent_agents', 1),
-            'memory_limit_gb': config.get('memory_limit_gb', 8),
-            'retry': config.get('retry', {}),
-            'notifications': config.get('notifications', {})
-        }
-
-        return system_config
+        self._cached_config()
+        return dict(self._system_config)
 
     def update_system_config(self, updates: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -226,17 +428,8 @@ class ConfigService:
         config = self.load_config()
 
         # Update allowed system fields
-        allowed_fields = [
-            'poll_interval_seconds',
-            'phase',
-            'max_concurrent_agents',
-            'memory_limit_gb',
-            'retry',
-            'notifications'
-        ]
-
         for key, value in updates.items():
-            if key in allowed_fields:
+            if key in SYSTEM_CONFIG_DEFAULTS:
                 config[key] = value
 
         self.save_config(config)
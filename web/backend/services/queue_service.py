@@ -5,13 +5,68 @@ Handles reading task queue files
 import json
 import os
 import re
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterator, Tuple
 from datetime import datetime
 import logging
 
+try:
+    import orjson
+except ImportError:  # Optional - falls back to the stdlib json parser
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Task files are parsed from bytes; orjson skips the text-decoding layer entirely
+_loads = orjson.loads if orjson is not None else json.loads
+
+TAIL_CHUNK_SIZE = 8192
+# Most bytes a tail read may pull in, even if the lines are very long
+TAIL_MAX_BYTES = 1024 * 1024
+# Directory mtimes this recent may still change within the same tick
+RACY_MTIME_NS = 1_000_000_000
+# Parse changed task files in parallel once a scan has this many to read
+PARALLEL_READ_MIN = 16
+READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+COMPLEXITY_LEVELS = ('simple', 'medium', 'complex', 'unknown')
+# Agent log names: agent-{project_id}-task-{issue_id}.log
+_LOG_NAME_RE = re.compile(r'agent-(.+?)-task-(\d+)\.log')
+
+
+def _read_tail(path: Path, lines: int, max_bytes: int = TAIL_MAX_BYTES) -> str:
+    """
+    Read the last lines of a file by seeking backwards from the end
+
+    Args:
+        path: File to read
+        lines: Number of lines to return
+        max_bytes: Stop after reading this much (the first line may then be partial)
+
+    Returns:
+        The last `lines` lines (fewer if the file is shorter)
+    """
+    chunks = []
+    newlines = 0
+
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        end = pos = f.tell()
+
+        # One newline more than needed, so the first kept line is complete
+        while pos > 0 and newlines <= lines and end - pos < max_bytes:
+            step = min(TAIL_CHUNK_SIZE, pos, max_bytes - (end - pos))
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            newlines += chunk.count(b'\n')
+            chunks.append(chunk)
+
+    tail = b''.join(reversed(chunks)).splitlines(keepends=True)[-lines:]
+    return b''.join(tail).decode('utf-8', errors='replace')
+
 
 class QueueService:
     """Service for managing task queue"""
@@ -55,6 +110,13 @@ class QueueService:
 
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
+        # Parsed task files, refreshed only when the queue directory changes
+        self._queue_mtime = None
+        self._task_files: Dict[str, tuple] = {}
+        self._queued: List[Dict[str, Any]] = []
+        # (scan result the stats were computed from, stats)
+        self._stats: Optional[tuple] = None
+
     def _get_task_status(self, project_id: str, issue_id: int) -> Dict[str, Any]:
         """
         Get task status by checking log files
@@ -83,41 +145,41 @@ class QueueService:
 
             try:
                 # Read last 100 lines of log
-                with open(log_file, 'r') as f:
-                    lines = f.readlines()
-                    last_lines = lines[-100:] if len(lines) > 100 else lines
-                    log_content = ''.join(last_lines)
-
-                    status_info['log_excerpt'] = log_content
-
-                    # Check for success/failure patterns
-                    if '[SUCCESS]' in log_content and 'PR created' in log_content:
-                        status_info['status'] = 'completed'
-                        status_info['success'] = True
-                    elif '[ERROR]' in log_content or 'Tests failed' in log_content:
-                        status_info['status'] = 'failed'
-                        status_info['failed'] = True
-                    elif '[INFO]' in log_content and 'Running Claude Code' in log_content:
-                        status_info['status'] = 'in-progress'
-                    elif 'No changes detected' in log_content:
-                        status_info['status'] = 'completed-no-changes'
-                        status_info['success'] = True
-
-                    # Get modification time
-                    stat = log_file.stat()
-                    status_info['completed_at'] = datetime.fromtimestamp(stat.st_mtime).isoformat()
+                log_content = _read_tail(log_file, 100)
+                status_info['log_excerpt'] = log_content
+
+                # Check for success/failure patterns
+                if '[SUCCESS]' in log_content and 'PR created' in log_content:
+                    status_info['status'] = 'completed'
+                    status_info['success'] = True
+                elif '[ERROR]' in log_content or 'Tests failed' in log_content:
+                    status_info['status'] = 'failed'
+                    status_info['failed'] = True
+                elif '[INFO]' in log_content and 'Running Claude Code' in log_content:
+                    status_info['status'] = 'in-progress'
+                elif 'No changes detected' in log_content:
+                    status_info['status'] = 'completed-no-changes'
+                    status_info['success'] = True
+
+                # Get modification time
+                stat = log_file.stat()
+                status_info['completed_at'] = datetime.fromtimestamp(stat.st_mtime).isoformat()
 
             except Exception as e:
                 logger.error(f"Error reading log file {log_file}: {e}")
 
         return status_info
 
-    def get_all_tasks_with_status(self, include_completed: bool = False) -> List[Dict[str, Any]]:
+    def get_all_tasks_with_status(self, include_completed: bool = False,
+                                  project_id: Optional[str] = None,
+                                  status: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Get all tasks (queued, in-progress, completed) with their status
 
         Args:
             include_completed: If True, include completed/failed tasks from logs (default: False)
+            project_id: Only return tasks for this project (optional)
+            status: Only return tasks with this status (optional)
 
         Returns:
             List of task dictionaries with status info
@@ -125,34 +187,46 @@ class QueueService:
         tasks = []
 
         # Get queued tasks
-        queued_tasks = self.get_queued_tasks()
+        queued_tasks = self.get_queued_tasks(project_id=project_id)
+        queued_keys = set()
         for task in queued_tasks:
-            project_id = task.get('project_id', 'unknown')
+            task_project = task.get('project_id', 'unknown')
             issue_id = task.get('issue_id', 0)
-            status_info = self._get_task_status(project_id, issue_id)
+            queued_keys.add((task_project, issue_id))
+
+            status_info = self._get_task_status(task_project, issue_id)
+            if status and status_info['status'] != status:
+                continue
             task.update(status_info)
             tasks.append(task)
 
         # Also check for completed tasks in logs (no queue file) - only if requested
-        if include_completed and self.log_dir.exists():
-            for log_file in self.log_dir.glob('agent-*-task-*.log'):
+        if include_completed:
+            prefix = f'agent-{project_id}-task-' if project_id else 'agent-'
+            for log_file in self._scan_dir(self.log_dir, prefix, '.log'):
                 # Parse filename: agent-{project_id}-task-{issue_id}.log
-                match = re.match(r'agent-(.+?)-task-(\d+)\.log', log_file.name)
+                match = _LOG_NAME_RE.match(log_file.name)
                 if match:
-                    project_id, issue_id = match.groups()
+                    log_project, issue_id = match.groups()
                     issue_id = int(issue_id)
 
+                    # The prefix also matches other projects, e.g. 'game-task-2' for 'game'
+                    if project_id and log_project != project_id:
+                        continue
+
                     # Check if this task is already in queued tasks
-                    if any(t.get('issue_id') == issue_id and t.get('project_id') == project_id for t in queued_tasks):
+                    if (log_project, issue_id) in queued_keys:
                         continue  # Already included
 
                     # This is a completed/failed task
-                    status_info = self._get_task_status(project_id, issue_id)
+                    status_info = self._get_task_status(log_project, issue_id)
+                    if status and status_info['status'] != status:
+                        continue
 
                     # Try to read basic info from log
                     task_data = {
                         'issue_id': issue_id,
-                        'project_id': project_id,
+                        'project_id': log_project,
                         'title': f'Task #{issue_id}',  # Placeholder
                         'complexity': 'unknown',
                         '_file': None,
@@ -163,39 +237,164 @@ class QueueService:
 
         return tasks
 
-    def get_queued_tasks(self) -> List[Dict[str, Any]]:
+    def _scan_queue(self) -> List[Dict[str, Any]]:
+        """
+        Get parsed task files, rescanning only when the queue directory changed
+
+        Tasks are published by create/rename/unlink, which all bump the
+        directory mtime. Files whose (mtime, size) are unchanged since the
+        last scan are not re-parsed.
+
+        Returns:
+            Cached task dictionaries sorted by queued time (don't mutate)
+        """
+        try:
+            dir_mtime = self.queue_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+
+        if dir_mtime == self._queue_mtime:
+            return self._queued
+
+        files = {}
+        to_read = []
+        with os.scandir(self.queue_dir) as entries:
+            for entry in entries:
+                if not (entry.name.startswith('task-') and entry.name.endswith('.json')):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError as e:
+                    logger.error(f"Error reading task file {entry.path}: {e}")
+                    continue
+
+                key = (stat.st_mtime_ns, stat.st_size)
+                cached = self._task_files.get(entry.name)
+                if cached and cached[0] == key:
+                    files[entry.name] = cached
+                else:
+                    to_read.append((entry, stat))
+
+        # Startup or a burst of new tasks: overlap the open/read/parse of each file
+        if len(to_read) >= PARALLEL_READ_MIN:
+            with ThreadPoolExecutor(max_workers=min(READ_WORKERS, len(to_read))) as pool:
+                parsed = list(pool.map(lambda item: self._read_task_file(item[0].path, item[1]),
+                                   to_read))
+        else:
+            parsed = [self._read_task_file(entry.path, stat) for entry, stat in to_read]
+
+        for (entry, stat), task in zip(to_read, parsed):
+            if task is not None:
+                files[entry.name] = ((stat.st_mtime_ns, stat.st_size), task)
+
+        # Sort by queued time (oldest first)
+        self._task_files = files
+        self._queued = sorted((task for _, task in files.values()),
+                              key=lambda t: t.get('_queued_at', ''))
+
+        # A change in the same timestamp tick as this scan wouldn't move the
+        # mtime, so only trust it once it is safely in the past
+        if time.time_ns() - dir_mtime > RACY_MTIME_NS:
+            self._queue_mtime = dir_mtime
+        else:
+            self._queue_mtime = None
+
+        return self._queued
+
+    @staticmethod
+    def _read_task_file(path: str, stat: os.stat_result) -> Optional[Dict[str, Any]]:
+        """
+        Parse one task file and add its file metadata
+
+        Args:
+            path: Path of the task file
+            stat: Its stat result
+
+        Returns:
+            Task dictionary, or None if the file couldn't be read
+        """
+        try:
+            with open(path, 'rb') as f:
+                task = _loads(f.read())
+
+            # Add file metadata
+            task['_file'] = os.path.basename(path)
+            task['_queued_at'] = datetime.fromtimestamp(stat.st_ctime).isoformat()
+            task['_size_bytes'] = stat.st_size
+
+            return task
+        except Exception as e:
+            logger.error(f"Error reading task file {path}: {e}")
+            return None
+
+    def get_queued_tasks(self, project_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Get all queued tasks
 
+        Args:
+            project_id: Only return tasks for this project (optional)
+
         Returns:
             List of task dictionaries
         """
-        tasks = []
+        # Copies, since callers add status fields to the dicts
+        return [dict(task) for task in self._scan_queue()
+                if not project_id or task.get('project_id') == project_id]
 
-        if not self.queue_dir.exists():
-            return tasks
+    @staticmethod
+    def _scan_dir(directory: Path, prefix: str, suffix: str) -> List[os.DirEntry]:
+        """
+        List files in a directory by name prefix/suffix using os.scandir
 
-        # Read all .json files in queue directory
-        for task_file in self.queue_dir.glob('task-*.json'):
-            try:
-                with open(task_file, 'r') as f:
-                    task = json.load(f)
+        Args:
+            directory: Directory to list
+            prefix: Required start of the file name
+            suffix: Required end of the file name
 
-                # Add file metadata
-                stat = task_file.stat()
-                task['_file'] = task_file.name
-                task['_queued_at'] = datetime.fromtimestamp(stat.st_ctime).isoformat()
-                task['_size_bytes'] = stat.st_size
+        Returns:
+            Matching directory entries (empty if the directory is missing)
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return [entry for entry in entries
+                        if entry.name.startswith(prefix) and entry.name.endswith(suffix)
+                        and entry.is_file()]
+        except FileNotFoundError:
+            return []
+
+    def _find_task_files(self, task_id: str) -> Iterator[Tuple[str, os.stat_result]]:
+        """
+        Find queue files that may hold a task, cheapest lookup first
 
-                tasks.append(task)
-            except Exception as e:
-                logger.error(f"Error reading task file {task_file}: {e}")
-                continue
+        Task files are usually named like: task-{project-id}-{issue-number}.json
+        or task-{issue-number}.json (legacy). The exact name is a single stat;
+        the directory is only scanned for other *{task_id}*.json files once
+        the caller asks for more candidates.
 
-        # Sort by queued time (oldest first)
-        tasks.sort(key=lambda t: t.get('_queued_at', ''))
+        Args:
+            task_id: Task ID to find
 
-        return tasks
+        Yields:
+            (path, stat) of each candidate file
+        """
+        exact = f"task-{task_id}.json"
+        if '/' not in task_id:
+            path = os.path.join(self.queue_dir, exact)
+            try:
+                stat = os.stat(path)
+            except (OSError, ValueError):
+                stat = None
+            if stat is not None:
+                yield path, stat
+
+        for entry in self._scan_dir(self.queue_dir, '', '.json'):
+            if task_id not in entry.name or entry.name == exact or entry.name.startswith('.'):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            yield entry.path, stat
 
     def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -207,32 +406,16 @@ class QueueService:
         Returns:
             Task dictionary or None if not found
         """
-        # Task files are usually named like: task-{project-id}-{issue-number}.json
-        # or task-{issue-number}.json (legacy)
-        possible_files = [
-            self.queue_dir / f"task-{task_id}.json",
-        ]
-
-        # Also try pattern matching
-        for task_file in self.queue_dir.glob(f'*{task_id}*.json'):
-            possible_files.append(task_file)
-
-        for task_file in possible_files:
-            if task_file.exists():
-                try:
-                    with open(task_file, 'r') as f:
-                        task = json.load(f)
-
-                    # Add file metadata
-                    stat = task_file.stat()
-                    task['_file'] = task_file.name
-                    task['_queued_at'] = datetime.fromtimestamp(stat.st_ctime).isoformat()
-                    task['_size_bytes'] = stat.st_size
-
-                    return task
-                except Exception as e:
-                    logger.error(f"Error reading task file {task_file}: {e}")
-                    continue
+        task_files = self._task_files
+        for path, stat in self._find_task_files(task_id):
+            # Reuse the queue scan's parse while the file is unchanged
+            cached = task_files.get(os.path.basename(path))
+            if cached and cached[0] == (stat.st_mtime_ns, stat.st_size):
+                return dict(cached[1])
+
+            task = self._read_task_file(path, stat)
+            if task is not None:
+                return task
 
         return None
 
@@ -246,24 +429,16 @@ class QueueService:
         Returns:
             True if successful, False otherwise
         """
-        # Find task file
-        possible_files = [
-            self.queue_dir / f"task-{task_id}.json",
-        ]
-
-        # Also try pattern matching
-        for task_file in self.queue_dir.glob(f'*{task_id}*.json'):
-            possible_files.append(task_file)
-
-        for task_file in possible_files:
-            if task_file.exists():
-                try:
-                    task_file.unlink()
-                    logger.info(f"Deleted task file: {task_file}")
-                    return True
-                except Exception as e:
-                    logger.error(f"Error deleting task file {task_file}: {e}")
-                    return False
+        for path, _ in self._find_task_files(task_id):
+            try:
+                os.unlink(path)
+                logger.info(f"Deleted task file: {path}")
+                return True
+            except FileNotFoundError:
+                continue  # Removed since it was found (e.g. picked up by an agent)
+            except Exception as e:
+                logger.error(f"Error deleting task file {path}: {e}")
+                return False
 
         logger.warning(f"Task file not found for ID: {task_id}")
         return False
@@ -272,34 +447,33 @@ class QueueService:
         """
         Get queue statistics
 
+        Recomputed only when the queue scan produced a new task list; the
+        returned dict is shared and must not be modified.
+
         Returns:
             Dictionary with queue stats
         """
-        tasks = self.get_queued_tasks()
+        tasks = self._scan_queue()
+        stats = self._stats
+        if stats is not None and stats[0] is tasks:
+            return stats[1]
 
         # Group by project
-        projects = {}
-        for task in tasks:
-            project_id = task.get('project_id', 'unknown')
-            if project_id not in projects:
-                projects[project_id] = 0
-            projects[project_id] += 1
-
-        # Group by complexity
-        complexity = {'simple': 0, 'medium': 0, 'complex': 0, 'unknown': 0}
-        for task in tasks:
-            c = task.get('complexity', 'unknown')
-            if c in complexity:
-                complexity[c] += 1
-            else:
-                complexity['unknown'] += 1
+        projects = dict(Counter(task.get('project_id', 'unknown') for task in tasks))
+
+        # Group by complexity (anything unrecognised counts as unknown)
+        complexity = dict.fromkeys(COMPLEXITY_LEVELS, 0)
+        for c, count in Counter(task.get('complexity', 'unknown') for task in tasks).items():
+            complexity[c if c in complexity else 'unknown'] += count
 
-        return {
+        stats = {
             'total_tasks': len(tasks),
             'by_project': projects,
             'by_complexity': complexity,
             'queue_dir': str(self.queue_dir)
         }
+        self._stats = (tasks, stats)
+        return stats
 
     def get_task_logs(self, project_id: str, issue_id: int, lines: int = None) -> Dict[str, Any]:
         """
@@ -308,7 +482,8 @@ class QueueService:
         Args:
             project_id: Project ID
             issue_id: Issue ID
-            lines: Number of lines to return (None = all lines)
+            lines: Number of lines to return (None = all lines; lines_count
+                is only filled in when the whole file is read)
 
         Returns:
             Dictionary with log content and metadata
@@ -333,15 +508,13 @@ class QueueService:
             result['size_bytes'] = stat.st_size
             result['modified_at'] = datetime.fromtimestamp(stat.st_mtime).isoformat()
 
-            # Read log file
-            with open(log_file, 'r') as f:
-                log_lines = f.readlines()
+            # Only the requested tail is read; lines_count needs the full file
+            if lines:
+                result['content'] = _read_tail(log_file, lines)
+            else:
+                with open(log_file, 'r') as f:
+                    log_lines = f.readlines()
                 result['lines_count'] = len(log_lines)
-
-                # Return requested number of lines or all
-                if lines:
-                    log_lines = log_lines[-lines:] if len(log_lines) > lines else log_lines
-
                 result['content'] = ''.join(log_lines)
 
         except Exception as e:
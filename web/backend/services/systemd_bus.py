@@ -0,0 +1,496 @@
+"""
+Systemd D-Bus Client
+Talks to org.freedesktop.systemd1 over one long-lived D-Bus connection,
+so status queries, unit control and reloads don't spawn a systemctl process
+"""
+import logging
+import os
+import threading
+import time
+from queue import Empty, Queue
+from typing import Dict, Iterable, List, Optional
+
+try:
+    from jeepney import (DBusAddress, DBusErrorResponse, HeaderFields, MatchRule, MessageType,
+                         message_bus, new_method_call)
+    from jeepney.wrappers import unwrap_msg
+    from jeepney.io.threading import DBusRouter, open_dbus_connection
+except ImportError:  # Optional - SystemdService falls back to the systemctl CLI
+    open_dbus_connection = None
+
+    class DBusErrorResponse(Exception):
+        """Placeholder so callers can name the exception without jeepney"""
+
+logger = logging.getLogger(__name__)
+
+SYSTEMD_BUS_NAME = 'org.freedesktop.systemd1'
+MESSAGE_BUS_NAME = 'org.freedesktop.DBus'
+MANAGER_PATH = '/org/freedesktop/systemd1'
+MANAGER_INTERFACE = 'org.freedesktop.systemd1.Manager'
+UNIT_INTERFACE = 'org.freedesktop.systemd1.Unit'
+PROPERTIES_INTERFACE = 'org.freedesktop.DBus.Properties'
+UNIT_PATH_PREFIX = '/org/freedesktop/systemd1/unit/'
+
+# Suffixes systemctl leaves alone; any other name gets '.service' appended
+UNIT_SUFFIXES = ('.service', '.socket', '.target', '.device', '.mount', '.automount',
+                 '.swap', '.timer', '.path', '.slice', '.scope')
+
+CALL_TIMEOUT = 10  # Seconds to wait for systemd to answer a method call
+JOB_TIMEOUT = 90  # Seconds to wait for a start/stop job (systemd's default unit timeout)
+JOB_QUEUE_SIZE = 256  # JobRemoved signals buffered while waiting for our own job
+UNIT_CACHE_MAX_AGE = 60  # Seconds before a signal-maintained unit is re-read anyway
+UNIT_CACHE_SIZE = 256  # Unit names come from request URLs, so keep it bounded
+BUS_RETRY_INTERVAL = 30  # Seconds to use systemctl before trying D-Bus again
+
+# One client per bus for the whole process: user_mode -> SystemdBus
+_buses: Dict[bool, 'SystemdBus'] = {}
+_retry_at: Dict[bool, float] = {}
+_buses_pid = None
+_buses_lock = threading.Lock()
+
+
+class BusUnavailable(Exception):
+    """The D-Bus connection failed; the caller should fall back to systemctl"""
+
+
+def unit_name(service_name: str) -> str:
+    """
+    Expand a service name the way systemctl does (issue-watcher -> issue-watcher.service)
+
+    Args:
+        service_name: Name with or without a unit type suffix
+
+    Returns:
+        Full unit name
+    """
+    if service_name.endswith(UNIT_SUFFIXES):
+        return service_name
+    return f"{service_name}.service"
+
+
+def unit_path(unit: str) -> str:
+    """
+    Get the D-Bus object path systemd exposes for a unit
+
+    Mirrors systemd's bus_label_escape(): every byte outside [A-Za-z0-9]
+    (and a leading digit) becomes _xx in hex.
+
+    Args:
+        unit: Full unit name (e.g., 'issue-watcher.service')
+
+    Returns:
+        Object path under /org/freedesktop/systemd1/unit/
+    """
+    label = []
+    for i, byte in enumerate(unit.encode('utf-8')):
+        char = chr(byte)
+        if char.isascii() and (char.isalpha() or (i > 0 and char.isdigit())):
+            label.append(char)
+        else:
+            label.append(f"_{byte:02x}")
+    return UNIT_PATH_PREFIX + (''.join(label) or '_')
+
+
+class SystemdBus:
+    """Minimal client for the systemd Manager and Unit D-Bus interfaces"""
+
+    def __init__(self, user_mode: bool = True):
+        """
+        Connect to the systemd instance on the session (user) or system bus
+
+        Args:
+            user_mode: If True, talk to the user manager on the session bus
+
+        Raises:
+            BusUnavailable: If jeepney isn't installed or the bus can't be reached
+        """
+        if open_dbus_connection is None:
+            raise BusUnavailable('jeepney not installed')
+
+        try:
+            self._conn = open_dbus_connection(bus='SESSION' if user_mode else 'SYSTEM')
+        except Exception as e:
+            raise BusUnavailable(f"Cannot connect to D-Bus: {e}") from e
+
+        # The router's receiver thread lets request threads share the connection
+        self._router = DBusRouter(self._conn)
+        self._subscribed = False
+        self._subscribe_lock = threading.Lock()
+
+        # Unit object path -> (serial, fetched_at, {property: value}), kept
+        # current by PropertiesChanged signals once subscribed
+        self._units: Dict[str, tuple] = {}
+        self._units_lock = threading.Lock()
+        self._signals: Optional[Queue] = None
+
+    def close(self) -> None:
+        """Stop the receiver and watcher threads and close the connection"""
+        if self._signals is not None:
+            self._signals.put(None)
+        try:
+            self._router.close()
+        finally:
+            self._conn.close()
+
+    def _call(self, path: str, interface: str, method: str,
+              signature: Optional[str] = None, body: tuple = ()) -> tuple:
+        """
+        Call a systemd method and wait for its reply
+
+        Returns:
+            Reply body
+
+        Raises:
+            DBusErrorResponse: systemd answered with an error
+            BusUnavailable: The connection failed or systemd didn't answer
+        """
+        address = DBusAddress(path, bus_name=SYSTEMD_BUS_NAME, interface=interface)
+        return self._send(new_method_call(address, method, signature, body))
+
+    def _send(self, message) -> tuple:
+        """Send a method call on the shared connection and unwrap its reply"""
+        return unwrap_msg(self._send_message(message))
+
+    def _send_message(self, message):
+        """
+        Send a method call on the shared connection
+
+        Returns:
+            Reply message (method return or systemd error)
+
+        Raises:
+            BusUnavailable: The connection failed or systemd isn't on the bus
+        """
+        try:
+            reply = self._router.send_and_get_reply(message, timeout=CALL_TIMEOUT)
+        except Exception as e:
+            raise BusUnavailable(f"D-Bus call failed: {e}") from e
+
+        # Errors from the bus daemon itself (no such name, activation failed)
+        # mean systemd isn't on this bus, not that it rejected the call
+        if (reply.header.message_type == MessageType.error
+                and reply.header.fields.get(HeaderFields.sender) == MESSAGE_BUS_NAME
+                and message.header.fields.get(HeaderFields.destination) != MESSAGE_BUS_NAME):
+            raise BusUnavailable(str(DBusErrorResponse(reply)))
+        return reply
+
+    def unit_properties(self, unit: str, names: Iterable[str]) -> Dict[str, str]:
+        """
+        Get Unit properties, formatted like `systemctl show`
+
+        Served from the signal-maintained cache when the unit has been read
+        before; otherwise fetched in one round trip. systemd loads unknown
+        units on demand, so a missing unit comes back with
+        LoadState=not-found rather than an error.
+
+        Args:
+            unit: Full unit name
+            names: Properties to return
+
+        Returns:
+            Property name -> value as a string
+        """
+        path = unit_path(unit)
+        try:
+            watching = self._subscribe()
+        except DBusErrorResponse as e:
+            logger.debug(f"Not caching unit properties: {e}")
+            watching = False
+
+        props = None
+        if watching:
+            with self._units_lock:
+                entry = self._units.get(path)
+            if entry is not None and time.monotonic() - entry[1] < UNIT_CACHE_MAX_AGE:
+                props = entry[2]
+
+        if props is None:
+            address = DBusAddress(path, bus_name=SYSTEMD_BUS_NAME, interface=PROPERTIES_INTERFACE)
+            reply = self._send_message(new_method_call(address, 'GetAll', 's', (UNIT_INTERFACE,)))
+            # Values arrive as (signature, value) variants
+            props = {name: value for name, (_sig, value) in unwrap_msg(reply)[0].items()}
+            if watching:
+                self._store_unit(path, reply.header.serial, props)
+
+        return {name: str(props[name]) for name in names if name in props}
+
+    def _store_unit(self, path: str, serial: int, props: Dict[str, object]) -> None:
+        """Cache a GetAll result unless a newer signal already updated the unit"""
+        with self._units_lock:
+            entry = self._units.get(path)
+            if entry is not None and entry[0] > serial:
+                return
+            if entry is None and len(self._units) >= UNIT_CACHE_SIZE:
+                self._units.clear()
+            self._units[path] = (serial, time.monotonic(), props)
+
+    def forget_unit(self, unit: str) -> None:
+        """
+        Drop a unit's cached properties so the next read asks systemd
+
+        Used after our own jobs: systemd may send the job result before the
+        unit's PropertiesChanged signal.
+
+        Args:
+            unit: Full unit name
+        """
+        with self._units_lock:
+            self._units.pop(unit_path(unit), None)
+
+    def run_job(self, method: str, unit: str) -> bool:
+        """
+        Queue a StartUnit/StopUnit/RestartUnit job and wait for it to finish,
+        like systemctl does
+
+        Args:
+            method: Manager method name
+            unit: Full unit name
+
+        Returns:
+            True if the job finished with result 'done', False otherwise
+        """
+        self._subscribe()
+
+        # Matched locally, where the sender is systemd's unique name, so no sender=
+        rule = MatchRule(type='signal', interface=MANAGER_INTERFACE, member='JobRemoved',
+                         path=MANAGER_PATH)
+        # Filter before queueing the job so a fast JobRemoved can't be missed
+        with self._router.filter(rule, bufsize=JOB_QUEUE_SIZE) as signals:
+            try:
+                (job,) = self._call(MANAGER_PATH, MANAGER_INTERFACE, method, 'ss',
+                                    (unit, 'replace'))
+            except DBusErrorResponse as e:
+                logger.error(f"systemd refused {method} for {unit}: {e}")
+                return False
+
+            deadline = time.monotonic() + JOB_TIMEOUT
+            while True:
+                try:
+                    message = signals.get(timeout=max(0.0, deadline - time.monotonic()))
+                except Empty:
+                    logger.error(f"Timed out waiting for {method} job on {unit}")
+                    return False
+
+                # JobRemoved(u id, o job, s unit, s result)
+                _job_id, job_path, _unit, result = message.body
+                if job_path == job:
+                    self.forget_unit(unit)
+                    return result == 'done'
+
+    def unit_file_state(self, unit: str) -> str:
+        """
+        Get a unit file's enablement state, like `systemctl is-enabled`
+
+        Args:
+            unit: Full unit name
+
+        Returns:
+            State such as 'enabled', 'disabled' or 'static' ('' if unknown)
+        """
+        try:
+            (state,) = self._call(MANAGER_PATH, MANAGER_INTERFACE, 'GetUnitFileState', 's',
+                                  (unit,))
+        except DBusErrorResponse:
+            return ''
+        return state
+
+    def unit_file_states(self, units: List[str]) -> Dict[str, str]:
+        """
+        Get several unit files' enablement states in one round trip,
+        like `systemctl list-unit-files UNIT...`
+
+        Args:
+            units: Full unit names
+
+        Returns:
+            Unit name -> state (units without a unit file are left out)
+        """
+        if not units:
+            return {}
+        try:
+            # (states to include - empty means all, name patterns) -> a(ss) of (path, state)
+            (files,) = self._call(MANAGER_PATH, MANAGER_INTERFACE, 'ListUnitFilesByPatterns',
+                                  'asas', ([], units))
+        except DBusErrorResponse:
+            # systemd older than v230
+            states = {unit: self.unit_file_state(unit) for unit in units}
+            return {unit: state for unit, state in states.items() if state}
+        return {path.rsplit('/', 1)[-1]: state for path, state in files}
+
+    def set_unit_file_enabled(self, unit: str, enabled: bool, reload: bool = True) -> bool:
+        """
+        Enable or disable a unit file, then reload like systemctl enable/disable
+
+        Args:
+            unit: Full unit name
+            enabled: True to enable, False to disable
+            reload: False to skip the reload, like systemctl --no-reload
+
+        Returns:
+            True if successful, False if systemd refused
+        """
+        try:
+            if enabled:
+                # (files, runtime, force)
+                self._call(MANAGER_PATH, MANAGER_INTERFACE, 'EnableUnitFiles', 'asbb',
+                           ([unit], False, False))
+            else:
+                # (files, runtime)
+                self._call(MANAGER_PATH, MANAGER_INTERFACE, 'DisableUnitFiles', 'asb',
+                           ([unit], False))
+        except DBusErrorResponse as e:
+            logger.error(f"systemd refused to {'enable' if enabled else 'disable'} {unit}: {e}")
+            return False
+
+        if reload:
+            self.reload()
+        self.forget_unit(unit)
+        return True
+
+    def reload(self) -> bool:
+        """
+        Re-read unit files, like `systemctl daemon-reload` (replies once done)
+
+        Returns:
+            True once the reload has finished
+
+        Raises:
+            DBusErrorResponse: systemd refused the reload
+        """
+        self._call(MANAGER_PATH, MANAGER_INTERFACE, 'Reload')
+        with self._units_lock:
+            self._units.clear()
+        return True
+
+    def _subscribe(self) -> bool:
+        """
+        Ask systemd to emit job and unit signals, have the bus route them to
+        us, and start the thread that applies them to the unit cache (once)
+
+        Returns:
+            True once subscribed
+
+        Raises:
+            DBusErrorResponse: systemd or the bus refused the subscription
+        """
+        with self._subscribe_lock:
+            if self._subscribed:
+                return True
+
+            # Filter locally before subscribing so no signal slips past the cache
+            signals = Queue()
+            handle = self._router.filter(MatchRule(type='signal', path_namespace=MANAGER_PATH),
+                                         queue=signals)
+            watcher = threading.Thread(target=self._watch, args=(signals,),
+                                       name='systemd-bus-watch', daemon=True)
+            watcher.start()
+
+            try:
+                for rule in (MatchRule(type='signal', sender=SYSTEMD_BUS_NAME,
+                                       interface=MANAGER_INTERFACE, path=MANAGER_PATH),
+                             MatchRule(type='signal', sender=SYSTEMD_BUS_NAME,
+                                       interface=PROPERTIES_INTERFACE, member='PropertiesChanged',
+                                       path_namespace=UNIT_PATH_PREFIX.rstrip('/'))):
+                    self._send(message_bus.AddMatch(rule))
+                self._call(MANAGER_PATH, MANAGER_INTERFACE, 'Subscribe')
+            except BaseException:
+                handle.close()
+                signals.put(None)
+                raise
+
+            self._signals = signals
+            self._subscribed = True
+            return True
+
+    def _watch(self, signals: Queue) -> None:
+        """Apply systemd signals to the unit cache until close() (watcher thread)"""
+        while True:
+            message = signals.get()
+            if message is None:
+                return
+            try:
+                self._apply_signal(message)
+            except Exception as e:
+                logger.debug(f"Ignoring malformed systemd signal: {e}")
+
+    def _apply_signal(self, message) -> None:
+        """
+        Update the unit cache from one systemd signal
+
+        Args:
+            message: Signal from systemd
+        """
+        member = message.header.fields.get(HeaderFields.member)
+        path = message.header.fields.get(HeaderFields.path)
+
+        with self._units_lock:
+            if member == 'PropertiesChanged':
+                interface, changed, invalidated = message.body
+                entry = self._units.get(path)
+                # Only units we already read, and never older than that read
+                if interface != UNIT_INTERFACE or entry is None or entry[0] > message.header.serial:
+                    return
+                if invalidated:
+                    del self._units[path]
+                    return
+                props = dict(entry[2])
+                props.update((name, value) for name, (_sig, value) in changed.items())
+                self._units[path] = (message.header.serial, entry[1], props)
+
+            elif member == 'UnitRemoved':
+                # UnitRemoved(s id, o unit)
+                self._units.pop(message.body[1], None)
+
+            elif member in ('Reloading', 'UnitFilesChanged'):
+                # Unit files were re-read or (en|dis)abled; UnitFileState
+                # changes aren't signalled per unit, so start over
+                self._units.clear()
+
+
+def get_bus(user_mode: bool = True) -> Optional[SystemdBus]:
+    """
+    Get the process-wide systemd D-Bus client, connecting on first use
+
+    Args:
+        user_mode: If True, the user manager on the session bus
+
+    Returns:
+        SystemdBus, or None to use systemctl (jeepney missing or no bus)
+    """
+    global _buses_pid
+    with _buses_lock:
+        # The router thread doesn't survive fork, so forked workers connect afresh
+        if _buses_pid != os.getpid():
+            _buses.clear()
+            _retry_at.clear()
+            _buses_pid = os.getpid()
+
+        bus = _buses.get(user_mode)
+        if bus is None and time.monotonic() >= _retry_at.get(user_mode, 0.0):
+            try:
+                bus = _buses[user_mode] = SystemdBus(user_mode=user_mode)
+            except BusUnavailable as e:
+                if user_mode not in _retry_at:
+                    logger.info(f"Using systemctl instead of D-Bus: {e}")
+                _retry_at[user_mode] = time.monotonic() + BUS_RETRY_INTERVAL
+        return bus
+
+
+def drop_bus(bus: SystemdBus, error: Exception) -> None:
+    """
+    Discard a failed client and use systemctl until the next retry
+
+    Args:
+        bus: Client whose call failed
+        error: The failure
+    """
+    logger.warning(f"systemd D-Bus call failed, falling back to systemctl: {error}")
+    with _buses_lock:
+        for user_mode, current in list(_buses.items()):
+            if current is bus:
+                del _buses[user_mode]
+                _retry_at[user_mode] = time.monotonic() + BUS_RETRY_INTERVAL
+    try:
+        bus.close()
+    except Exception:
+        pass
@@ -5,12 +5,30 @@ Handles checking and controlling systemd services
 import subprocess
 import logging
 import os
+import shutil
+import time
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Any, Callable, Dict, Optional, List
 from datetime import datetime
+from services.systemd_bus import SystemdBus, BusUnavailable, drop_bus, get_bus, unit_name
 
 logger = logging.getLogger(__name__)
 
+# Unit properties fetched in one `systemctl show` call for status queries
+STATUS_PROPERTIES = ('LoadState', 'ActiveState', 'SubState', 'UnitFileState',
+                     'ActiveEnterTimestampMonotonic')
+
+STATUS_TTL = 1.5  # Seconds a status result is reused between dashboard polls
+STATUS_CACHE_SIZE = 64  # Service names come from request URLs, so keep it bounded
+UNIT_FILE_MODE = 0o644
+# Directory mtimes this recent may still change within the same tick
+RACY_MTIME_NS = 1_000_000_000
+# systemctl errors meaning its bus isn't up yet (early boot), worth a retry
+BUS_NOT_READY = (b'Failed to connect to bus', b'Failed to get D-Bus connection')
+SYSTEMCTL_ATTEMPTS = 3
+
 
 class SystemdService:
     """Service for managing systemd services"""
@@ -30,68 +48,267 @@ class SystemdService:
         else:
             self.service_dir = Path('/etc/systemd/system')
 
+        # Resolved once: every call either execs this path directly or, when
+        # systemctl is missing, fails fast without spawning anything
+        self._systemctl = shutil.which('systemctl')
+        if self._systemctl is None:
+            logger.warning("systemctl not found - running without systemd?")
+
+        # Fixed argv prefixes, built once; callers append unit names
+        base = (self._systemctl or 'systemctl',) + tuple(self.systemctl_args[1:])
+        self._cmd_prefix = {
+            verb: base + (verb,)
+            for verb in ('start', 'stop', 'restart', 'enable', 'disable', 'daemon-reload')
+        }
+        self._cmd_prefix['show'] = base + (
+            'show', f"--property={','.join(STATUS_PROPERTIES)}", '--')
+        self._cmd_prefix['list-unit-files'] = base + (
+            'list-unit-files', '--type=service', '--no-legend', '--no-pager', '--')
+
         # Ensure service directory exists
-        self.service_dir.mkdir(parents=True, exist_ok=True)
+        if not self.service_dir.is_dir():
+            self.service_dir.mkdir(parents=True, exist_ok=True)
+
+        # Short-lived status results: service name -> (monotonic time, status)
+        self._status_cache: Dict[str, tuple] = {}
+        self._overview_cache: tuple = (0.0, None)
+        self._cache_lock = threading.Lock()
+
+        # Unit files keyed on the directory mtime, and the last list_services()
+        # result: (monotonic time, unit files it was built from, services)
+        self._files_cache: tuple = (None, [])
+        self._list_cache: tuple = (0.0, None, None)
+
+        # Per-thread batch() nesting, so one request's batch can't delay another's reload
+        self._batch = threading.local()
+
+    @contextmanager
+    def batch(self):
+        """
+        Group unit file changes so systemd reloads once at the end
+
+        create_service, update_service and delete_service inside the block
+        skip their own daemon-reload; one reload runs when the outermost
+        block exits (also on error, since files may already have changed).
+
+        Usage:
+            with systemd_service.batch():
+                systemd_service.create_service('a', content_a)
+                systemd_service.create_service('b', content_b)
+        """
+        depth = getattr(self._batch, 'depth', 0)
+        if depth == 0:
+            self._batch.reload_pending = False
+        self._batch.depth = depth + 1
+        try:
+            yield self
+        finally:
+            self._batch.depth = depth
+            if depth == 0 and self._batch.reload_pending:
+                self._batch.reload_pending = False
+                self._daemon_reload()
+
+    def _defer_reload(self) -> bool:
+        """
+        Check for an enclosing batch(), marking its reload as due
+
+        Returns:
+            True if the caller should skip its own reload
+        """
+        if getattr(self._batch, 'depth', 0):
+            self._batch.reload_pending = True
+            return True
+        return False
+
+    def _with_bus(self, operation: Callable[[SystemdBus], Any]) -> Any:
+        """
+        Run an operation on the process-wide D-Bus client
+
+        Args:
+            operation: Called with the SystemdBus; must not return None
+
+        Returns:
+            The operation's result, or None if D-Bus is unusable (use systemctl)
+        """
+        bus = get_bus(self.user_mode)
+        if bus is None:
+            return None
+        try:
+            return operation(bus)
+        except BusUnavailable as e:
+            drop_bus(bus, e)
+            return None
+
+    def _require_systemctl(self) -> None:
+        """
+        Fail fast when systemctl isn't installed
+
+        Raises:
+            FileNotFoundError: If systemctl wasn't found at startup
+        """
+        if self._systemctl is None:
+            raise FileNotFoundError('systemctl')
+
+    @staticmethod
+    def _spawn(cmd: tuple, stdout: int) -> subprocess.CompletedProcess:
+        """
+        Run a systemctl command, retrying briefly while its bus isn't ready
+
+        Args:
+            cmd: Full argv
+            stdout: subprocess.PIPE or subprocess.DEVNULL
+
+        Returns:
+            The last attempt's result (stdout/stderr as bytes)
+        """
+        for attempt in range(SYSTEMCTL_ATTEMPTS):
+            result = subprocess.run(cmd, stdout=stdout, stderr=subprocess.PIPE)
+            if (result.returncode == 0 or attempt == SYSTEMCTL_ATTEMPTS - 1
+                    or not any(marker in result.stderr for marker in BUS_NOT_READY)):
+                break
+            logger.warning(f"systemctl bus not ready, retrying: {' '.join(cmd)}")
+            time.sleep(0.2 * 2 ** attempt)
+        return result
+
+    def _run_systemctl(self, verb: str, *args: str) -> bool:
+        """
+        Run a systemctl command whose output isn't needed
+
+        stdout goes to /dev/null; stderr is kept only to log why it failed.
+
+        Args:
+            verb: systemctl command (e.g., 'start')
+            *args: Arguments after the verb
+
+        Returns:
+            True if systemctl exited successfully
+        """
+        if self._systemctl is None:
+            logger.error(f"systemctl {verb} {' '.join(args)} failed: systemctl not found")
+            return False
+
+        result = self._spawn(self._cmd_prefix[verb] + args, subprocess.DEVNULL)
+        if result.returncode != 0:
+            error = result.stderr.decode(errors='replace').strip()
+            logger.error(f"systemctl {verb} {' '.join(args)} failed: {error}")
+        return result.returncode == 0
+
+    def _daemon_reload(self) -> None:
+        """
+        Make systemd re-read unit files (deferred inside batch())
+
+        Raises:
+            Exception: If the reload failed
+        """
+        if self._defer_reload():
+            return
+
+        if self._with_bus(lambda bus: bus.reload()) is None:
+            self._require_systemctl()
+            self._spawn(self._cmd_prefix['daemon-reload'], subprocess.DEVNULL).check_returncode()
+
+    def invalidate(self, service_name: Optional[str] = None) -> None:
+        """
+        Drop cached status after a service's state or unit file changed
+
+        Args:
+            service_name: Service to forget (None = all services)
+        """
+        with self._cache_lock:
+            if service_name is None:
+                self._status_cache.clear()
+            else:
+                self._status_cache.pop(service_name, None)
+            self._overview_cache = (0.0, None)
+            self._list_cache = (0.0, None, None)
 
     def get_service_status(self, service_name: str) -> Dict[str, any]:
         """
         Get detailed status of a systemd service
 
+        Results are reused for STATUS_TTL seconds; the returned dict is
+        shared and must not be modified.
+
         Args:
             service_name: Name of the service (e.g., 'issue-watcher')
 
+        Returns:
+            Dictionary with status information
+        """
+        with self._cache_lock:
+            cached = self._status_cache.get(service_name)
+        if cached and time.monotonic() - cached[0] < STATUS_TTL:
+            return cached[1]
+
+        status = self._fetch_service_status(service_name)
+        with self._cache_lock:
+            if len(self._status_cache) >= STATUS_CACHE_SIZE:
+                self._status_cache.clear()
+            self._status_cache[service_name] = (time.monotonic(), status)
+        return status
+
+    def _fetch_service_status(self, service_name: str) -> Dict[str, any]:
+        """
+        Query systemd for a service's status (uncached)
+
+        Args:
+            service_name: Name of the service
+
         Returns:
             Dictionary with status information
         """
         try:
-            # Check if service is active
-            is_active_cmd = self.systemctl_args + ['is-active', service_name]
-            result = subprocess.run(is_active_cmd, capture_output=True, text=True)
-            is_active = result.stdout.strip() == 'active'
-
-            # Get detailed status
-            status_cmd = self.systemctl_args + ['status', service_name]
-            status_result = subprocess.run(status_cmd, capture_output=True, text=True)
-
-            # Parse status output for uptime (simplified)
-            status_lines = status_result.stdout.split('\n')
-            uptime_seconds = 0
-            loaded = False
-
-            for line in status_lines:
-                if 'Loaded:' in line:
-                    loaded = 'loaded' in line.lower()
-                if 'Active:' in line and 'since' in line:
-                    # Try to parse uptime (simplified - just return 0 for now)
-                    # Full implementation would parse the timestamp
-                    uptime_seconds = 0
-
-            return {
-                'name': service_name,
-                'status': 'running' if is_active else 'stopped',
-                'loaded': loaded,
-                'uptime_seconds': uptime_seconds,
-                'raw_status': status_result.stdout if is_active else None
-            }
+            props = self._show_units([service_name])[0]
+            return self._status_from_properties(service_name, props)
 
         except FileNotFoundError:
             logger.warning(f"systemctl not found - running without systemd?")
-            return {
-                'name': service_name,
-                'status': 'unknown',
-                'loaded': False,
-                'uptime_seconds': 0,
-                'error': 'systemd not available'
-            }
+            return self._error_status(service_name, 'unknown', 'systemd not available')
         except Exception as e:
             logger.error(f"Error checking service {service_name}: {e}")
-            return {
-                'name': service_name,
-                'status': 'error',
-                'loaded': False,
-                'uptime_seconds': 0,
-                'error': str(e)
-            }
+            return self._error_status(service_name, 'error', str(e))
+
+    @staticmethod
+    def _status_from_properties(service_name: str, props: Dict[str, str]) -> Dict[str, any]:
+        """
+        Build the API status dictionary from `systemctl show` properties
+
+        Args:
+            service_name: Name of the service
+            props: Its STATUS_PROPERTIES values
+
+        Returns:
+            Dictionary with status information
+        """
+        is_active = props.get('ActiveState') == 'active'
+
+        # Microseconds on CLOCK_MONOTONIC, the same clock as time.monotonic_ns()
+        uptime_seconds = 0
+        entered = props.get('ActiveEnterTimestampMonotonic', '')
+        if is_active and entered.isdigit() and int(entered) > 0:
+            now_us = time.monotonic_ns() // 1000
+            uptime_seconds = max(0, (now_us - int(entered)) // 1_000_000)
+
+        return {
+            'name': service_name,
+            'status': 'running' if is_active else 'stopped',
+            'loaded': props.get('LoadState') == 'loaded',
+            'uptime_seconds': uptime_seconds,
+            'active_state': props.get('ActiveState'),
+            'sub_state': props.get('SubState'),
+            'unit_file_state': props.get('UnitFileState')
+        }
+
+    @staticmethod
+    def _error_status(service_name: str, status: str, error: str) -> Dict[str, any]:
+        """Status dictionary for a service whose state couldn't be read"""
+        return {
+            'name': service_name,
+            'status': status,
+            'loaded': False,
+            'uptime_seconds': 0,
+            'error': error
+        }
 
     def start_service(self, service_name: str) -> bool:
         """
@@ -104,9 +321,12 @@ class SystemdService:
             True if successful, False otherwise
         """
         try:
-            cmd = self.systemctl_args + ['start', service_name]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            return result.returncode == 0
+            success = self._with_bus(
+                lambda bus: bus.run_job('StartUnit', unit_name(service_name)))
+            if success is None:
+                success = self._run_systemctl('start', service_name)
+            self.invalidate(service_name)
+            return success
         except Exception as e:
             logger.error(f"Error starting service {service_name}: {e}")
             return False
@@ -122,9 +342,12 @@ class SystemdService:
             True if successful, False otherwise
         """
         try:
-            cmd = self.systemctl_args + ['stop', service_name]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            return result.returncode == 0
+            success = self._with_bus(
+                lambda bus: bus.run_job('StopUnit', unit_name(service_name)))
+            if success is None:
+                success = self._run_systemctl('stop', service_name)
+            self.invalidate(service_name)
+            return success
         except Exception as e:
             logger.error(f"Error stopping service {service_name}: {e}")
             return False
@@ -140,9 +363,12 @@ class SystemdService:
             True if successful, False otherwise
         """
         try:
-            cmd = self.systemctl_args + ['restart', service_name]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            return result.returncode == 0
+            success = self._with_bus(
+                lambda bus: bus.run_job('RestartUnit', unit_name(service_name)))
+            if success is None:
+                success = self._run_systemctl('restart', service_name)
+            self.invalidate(service_name)
+            return success
         except Exception as e:
             logger.error(f"Error restarting service {service_name}: {e}")
             return False
@@ -151,48 +377,176 @@ class SystemdService:
         """
         Get status of all Lazy_Bird services (dynamically scans filesystem)
 
+        Queries every unit with a single `systemctl show` call instead of
+        two systemctl processes per service. Results are reused for
+        STATUS_TTL seconds and must not be modified.
+
+        Returns:
+            Dictionary mapping service names to status info
+        """
+        with self._cache_lock:
+            fetched_at, statuses = self._overview_cache
+        if statuses is not None and time.monotonic() - fetched_at < STATUS_TTL:
+            return statuses
+
+        statuses = self._fetch_all_services_status()
+        with self._cache_lock:
+            self._overview_cache = (time.monotonic(), statuses)
+        return statuses
+
+    def _fetch_all_services_status(self) -> Dict[str, Dict]:
+        """
+        Query systemd for every service file's status (uncached)
+
         Returns:
             Dictionary mapping service names to status info
         """
         # Get list of actual service files from filesystem
-        service_files = self.list_services()
-        statuses = {}
+        try:
+            service_names = [entry.name[:-len('.service')] for entry in self._service_files()]
+        except OSError as e:
+            logger.error(f"Error listing services: {e}")
+            return {}
+        if not service_names:
+            return {}
 
-        for service_info in service_files:
-            service_name = service_info['name']
-            statuses[service_name] = self.get_service_status(service_name)
+        try:
+            units = self._show_units(service_names)
+        except FileNotFoundError:
+            return {name: self._error_status(name, 'unknown', 'systemd not available')
+                    for name in service_names}
+        except Exception as e:
+            logger.error(f"Error checking services: {e}")
+            return {name: self._error_status(name, 'error', str(e)) for name in service_names}
 
-        return statuses
+        return {name: self._status_from_properties(name, props)
+                for name, props in zip(service_names, units)}
+
+    def _show_units(self, service_names: List[str]) -> List[Dict[str, str]]:
+        """
+        Fetch STATUS_PROPERTIES for several units
+
+        Uses the D-Bus connection when available, otherwise one systemctl call.
+
+        Args:
+            service_names: Names of the services, in the order to return them
+
+        Returns:
+            One property dictionary per service, in the same order
+        """
+        units = self._with_bus(lambda bus: [bus.unit_properties(unit_name(name), STATUS_PROPERTIES)
+                                            for name in service_names])
+        if units is not None:
+            return units
+
+        self._require_systemctl()
+        cmd = self._cmd_prefix['show'] + tuple(service_names)
+        result = self._spawn(cmd, subprocess.PIPE)
+
+        # STATUS_PROPERTIES values are all ASCII (states and timestamps)
+        stdout = result.stdout.decode('ascii', errors='replace').strip()
+
+        # systemctl prints one KEY=value block per unit, separated by blank lines
+        blocks = stdout.split('\n\n') if stdout else []
+        if len(blocks) != len(service_names):
+            raise RuntimeError(result.stderr.decode(errors='replace').strip() or
+                               f"systemctl show returned {len(blocks)} of {len(service_names)} units")
+
+        units = []
+        for block in blocks:
+            props = {}
+            for line in block.splitlines():
+                key, sep, value = line.partition('=')
+                if sep:
+                    props[key] = value
+            units.append(props)
+        return units
+
+    def _service_files(self) -> List[os.DirEntry]:
+        """
+        List the *.service files, re-scanning only when the directory changed
+
+        Returns:
+            Unit file directory entries (shared between calls, must not be modified)
+        """
+        mtime = self.service_dir.stat().st_mtime_ns
+        cached_mtime, service_files = self._files_cache
+        if mtime != cached_mtime:
+            # scandir's cached file type avoids a stat per entry (symlinked units still count)
+            with os.scandir(self.service_dir) as entries:
+                service_files = [entry for entry in entries
+                                 if entry.name.endswith('.service') and entry.is_file()]
+            # A change in the same timestamp tick wouldn't move the mtime
+            if time.time_ns() - mtime <= RACY_MTIME_NS:
+                mtime = None
+            self._files_cache = (mtime, service_files)
+        return service_files
 
     def list_services(self) -> List[Dict[str, any]]:
         """
         List all service files in the systemd directory
 
+        Reused for STATUS_TTL seconds while the directory is unchanged
+        (enable state lives outside it, under *.wants/).
+
         Returns:
             List of dictionaries with service information
         """
         services = []
         try:
-            for service_file in self.service_dir.glob('*.service'):
-                service_name = service_file.stem
+            service_files = self._service_files()
+
+            with self._cache_lock:
+                fetched_at, cached_files, cached = self._list_cache
+            if (cached is not None and cached_files is service_files
+                    and time.monotonic() - fetched_at < STATUS_TTL):
+                return list(cached)
 
-                # Get enabled status
-                is_enabled_cmd = self.systemctl_args + ['is-enabled', service_name]
-                result = subprocess.run(is_enabled_cmd, capture_output=True, text=True)
-                enabled = result.stdout.strip() == 'enabled'
+            # Get enabled status
+            filenames = [entry.name for entry in service_files]
+            states = self._with_bus(lambda bus: bus.unit_file_states(filenames))
+            if states is None:
+                states = self._list_unit_files(filenames)
 
+            for entry in service_files:
                 services.append({
-                    'name': service_name,
-                    'filename': service_file.name,
-                    'path': str(service_file),
-                    'enabled': enabled
+                    'name': entry.name[:-len('.service')],
+                    'filename': entry.name,
+                    'path': entry.path,
+                    'enabled': states.get(entry.name) == 'enabled'
                 })
 
-            return services
+            with self._cache_lock:
+                self._list_cache = (time.monotonic(), service_files, services)
+            return list(services)
         except Exception as e:
             logger.error(f"Error listing services: {e}")
             return []
 
+    def _list_unit_files(self, unit_names: List[str]) -> Dict[str, str]:
+        """
+        Get unit file states with one `systemctl list-unit-files` call
+
+        Args:
+            unit_names: Full unit names (e.g., 'issue-watcher.service')
+
+        Returns:
+            Unit name -> state such as 'enabled' (missing units are left out)
+        """
+        if not unit_names or self._systemctl is None:
+            return {}
+
+        cmd = self._cmd_prefix['list-unit-files'] + tuple(unit_names)
+        result = self._spawn(cmd, subprocess.PIPE)
+
+        # One "UNIT FILE  STATE  [PRESET]" row per unit
+        states = {}
+        for line in result.stdout.decode(errors='replace').splitlines():
+            parts = line.split()
+            if len(parts) >= 2:
+                states[parts[0]] = parts[1]
+        return states
+
     def get_service_file(self, service_name: str) -> Optional[str]:
         """
         Read service file content
@@ -212,6 +566,32 @@ class SystemdService:
             logger.error(f"Error reading service file {service_name}: {e}")
             return None
 
+    @staticmethod
+    def _write_unit_file(service_file: Path, content: str) -> None:
+        """
+        Write a unit file via a temp file and rename, so systemd never reads
+        a half-written unit (no fsync, like config.yml saves)
+
+        Args:
+            service_file: Path to the unit file
+            content: Unit file content
+        """
+        # Replace the real file, not a symlink pointing at it
+        target = service_file.resolve()
+        tmp_path = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+        # Created with the final mode; chmod only if the umask took bits away
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, UNIT_FILE_MODE)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                if os.fstat(fd).st_mode & 0o777 != UNIT_FILE_MODE:
+                    os.fchmod(fd, UNIT_FILE_MODE)
+                f.write(content)
+            os.replace(tmp_path, target)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
     def create_service(self, service_name: str, content: str) -> bool:
         """
         Create a new service file
@@ -231,13 +611,12 @@ class SystemdService:
                 logger.error(f"Service {service_name} already exists")
                 return False
 
-            service_file.write_text(content)
-            service_file.chmod(0o644)
+            self._write_unit_file(service_file, content)
 
             # Reload systemd daemon
-            reload_cmd = self.systemctl_args + ['daemon-reload']
-            subprocess.run(reload_cmd, check=True)
+            self._daemon_reload()
 
+            self.invalidate(service_name)
             logger.info(f"Created service {service_name}")
             return True
         except Exception as e:
@@ -263,13 +642,12 @@ class SystemdService:
                 logger.error(f"Service {service_name} does not exist")
                 return False
 
-            service_file.write_text(content)
-            service_file.chmod(0o644)
+            self._write_unit_file(service_file, content)
 
             # Reload systemd daemon
-            reload_cmd = self.systemctl_args + ['daemon-reload']
-            subprocess.run(reload_cmd, check=True)
+            self._daemon_reload()
 
+            self.invalidate(service_name)
             logger.info(f"Updated service {service_name}")
             return True
         except Exception as e:
@@ -293,19 +671,30 @@ class SystemdService:
                 logger.error(f"Service {service_name} does not exist")
                 return False
 
-            # Stop service if running
-            self.stop_service(service_name)
+            # One state query decides whether stop/disable are needed at all
+            try:
+                props = self._show_units([service_name])[0]
+            except Exception as e:
+                logger.warning(f"Could not read state of {service_name}, stopping anyway: {e}")
+                props = {}
 
-            # Disable if enabled
-            self.disable_service(service_name)
+            # Disabling and deleting share the one reload at the end
+            with self.batch():
+                # Stop service if running
+                if props.get('ActiveState') not in ('inactive', 'failed'):
+                    self.stop_service(service_name)
 
-            # Delete file
-            service_file.unlink()
+                # Disable if enabled
+                if props.get('UnitFileState', 'enabled').startswith('enabled'):
+                    self.disable_service(service_name)
 
-            # Reload systemd daemon
-            reload_cmd = self.systemctl_args + ['daemon-reload']
-            subprocess.run(reload_cmd, check=True)
+                # Delete file
+                service_file.unlink()
+
+                # Reload systemd daemon
+                self._daemon_reload()
 
+            self.invalidate(service_name)
             logger.info(f"Deleted service {service_name}")
             return True
         except Exception as e:
@@ -323,9 +712,14 @@ class SystemdService:
             True if successful, False otherwise
         """
         try:
-            cmd = self.systemctl_args + ['enable', service_name]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            return result.returncode == 0
+            deferred = self._defer_reload()
+            success = self._with_bus(lambda bus: bus.set_unit_file_enabled(
+                unit_name(service_name), True, reload=not deferred))
+            if success is None:
+                args = ('--no-reload',) if deferred else ()
+                success = self._run_systemctl('enable', service_name, *args)
+            self.invalidate(service_name)
+            return success
         except Exception as e:
             logger.error(f"Error enabling service {service_name}: {e}")
             return False
@@ -341,9 +735,14 @@ class SystemdService:
             True if successful, False otherwise
         """
         try:
-            cmd = self.systemctl_args + ['disable', service_name]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            return result.returncode == 0
+            deferred = self._defer_reload()
+            success = self._with_bus(lambda bus: bus.set_unit_file_enabled(
+                unit_name(service_name), False, reload=not deferred))
+            if success is None:
+                args = ('--no-reload',) if deferred else ()
+                success = self._run_systemctl('disable', service_name, *args)
+            self.invalidate(service_name)
+            return success
         except Exception as e:
             logger.error(f"Error disabling service {service_name}: {e}")
             return False
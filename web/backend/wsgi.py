@@ -0,0 +1,9 @@
+"""
+WSGI entry point for production servers
+
+Usage (from the repository root):
+    gunicorn -k gthread -w 4 --threads 8 --keep-alive 30 --preload --chdir web/backend wsgi:app
+"""
+from app import app
+
+__all__ = ['app']
@@ -34,7 +34,9 @@ export interface ServiceStatus {
   status: 'running' | 'stopped' | 'error' | 'unknown';
   loaded: boolean;
   uptime_seconds: number;
-  raw_status?: string;
+  active_state?: string;
+  sub_state?: string;
+  unit_file_state?: string;
   error?: string;
 }
 